@@ -0,0 +1,1237 @@
+#!/usr/bin/env python3
+
+"""
+usage: _bench_.py [-h] [--only NAME] [--json FILE] [--baseline FILE] [--slack PCT]
+
+time the Py near here, to show which costs grow, and which stay flat
+
+optional arguments:
+  -h, --help       show this help message and exit
+  --only NAME      run only the benches whose names contain this name
+  --json FILE      write the median milliseconds of each bench row into a Json file
+  --baseline FILE  compare with a Json file written before, and exit 1 if slower
+  --slack PCT      slow by less than this percent isn't slower (default: 25)
+
+quirks:
+  doesn't count a row as slower when it's slower by less than 1 ms
+  doesn't compare rows missing from the baseline, nor from these results
+  shows a missing baseline file as nothing to compare with, not as an error
+
+examples:
+  bin/_bench_.py --only verb  # time just the 'argv__to_*_py' and 'bin/*.py' benches
+  bin/_bench_.py --json bench-baseline.json  # write a baseline
+  bin/_bench_.py --json bench.json --baseline bench-baseline.json  # compare with it
+"""
+
+import contextlib
+import functools
+import importlib
+import inspect
+import io
+import json
+import os
+import re
+import shlex
+import shutil
+import signal
+import stat
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import textwrap
+import time
+
+import _scraps_
+
+
+FILE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+RESULTS = dict()  # the median milliseconds of each row, by bench
+
+
+def main():
+
+    args = parse_bench_args(sys.argv)
+
+    # Run each bench chosen
+
+    benches = (
+        bench_shell2py_startup,
+        bench_shell2py_server,
+        bench_shell2py_batch,
+        bench_py_cache,
+        bench_pyc_cache,
+        bench_py_pick,
+        bench_py_dedent,
+        bench_py_index,
+        bench_verb_examples,
+        bench_verb_runs,
+        bench_ls_rows,
+        bench_ls_ndjson,
+        bench_ls_lookahead,
+        bench_ls_columns,
+        bench_find_walk,
+    )
+
+    for bench in benches:
+        if (args.only is None) or (args.only in bench.__name__):
+            bench()
+
+    sys.stderr.write("_bench_.py: benches ran\n")
+
+    # Write the results, and compare them with the baseline
+
+    if args.json:
+        with open(args.json, "w") as writing:
+            json.dump(RESULTS, writing, indent=2, sort_keys=True)
+            writing.write("\n")
+
+    if args.baseline:
+        exit_if_slower(args.baseline, slack=args.slack)
+
+
+def parse_bench_args(argv):
+    """Parse the ArgV of Bench, else print some Help and quit"""
+
+    parser = _scraps_.compile_argdoc(epi="quirks:")
+
+    parser.add_argument(
+        "--only",
+        metavar="NAME",
+        help="run only the benches whose names contain this name",
+    )
+    parser.add_argument(
+        "--json",
+        metavar="FILE",
+        help="write the median milliseconds of each bench row into a Json file",
+    )
+    parser.add_argument(
+        "--baseline",
+        metavar="FILE",
+        help="compare with a Json file written before, and exit 1 if slower",
+    )
+    parser.add_argument(
+        "--slack",
+        metavar="PCT",
+        type=float,
+        default=25,
+        help="slow by less than this percent isn't slower (default: 25)",
+    )
+
+    _scraps_.exit_unless_doc_eq(parser)
+
+    args = parser.parse_args(argv[1:])
+
+    return args
+
+
+#
+# Time the start of Shell2Py, as more Verbs join the Dir
+#
+
+
+def bench_shell2py_startup(more_verbs_counts=(0, 10, 100), repeats=9):
+    """Show that 'shell2py VERB' starts up as fast, no matter how many Verbs exist"""
+
+    print("shell2py echo startup, as more verbs join the dir")
+    print("verbs  lazy_ms  eager_ms")
+
+    for more_verbs in more_verbs_counts:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            verbs = copy_verbs_to(tmp_dir, more_verbs=more_verbs)
+
+            shell2py_py = os.path.join(tmp_dir, "shell2py.py")
+            lazy_argv = [sys.executable, shell2py_py, "echo", "hi"]
+
+            eager_py = "import sys; sys.path[:0] = [{!r}]; import {}".format(
+                tmp_dir, ", ".join(verbs)
+            )
+            eager_argv = [sys.executable, "-c", eager_py]
+
+            lazy_ms = argv_median_ms(lazy_argv, repeats=repeats)
+            eager_ms = argv_median_ms(eager_argv, repeats=repeats)
+
+            print("{:5d}  {:7.1f}  {:8.1f}".format(len(verbs), lazy_ms, eager_ms))
+
+            record_ms("{} verbs lazy".format(len(verbs)), ms=lazy_ms)
+            record_ms("{} verbs eager".format(len(verbs)), ms=eager_ms)
+
+
+def bench_shell2py_server(repeats=9):
+    """Show how much faster 'shell2py VERB' runs while a 'shell2py --serve' runs"""
+
+    print()
+    print("shell2py translation, in-process vs asking a 'shell2py --serve'")
+    print("argv             in_process_ms  served_ms")
+
+    argvs = (["echo", "hi"], ["ls", "-1"], ["tar", "tvf", "dir.tgz"])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        copy_verbs_to(tmp_dir, more_verbs=0)
+
+        shell2py_py = os.path.join(tmp_dir, "shell2py.py")
+        client_py = os.path.join(tmp_dir, "_client_.py")
+        socket_path = os.path.join(tmp_dir, "__pycache__", "shell2py.sock")
+
+        in_process_ms_list = list()
+        for argv in argvs:
+            shell2py_argv = [sys.executable, shell2py_py] + argv
+            in_process_ms = argv_median_ms(shell2py_argv, repeats=repeats)
+            in_process_ms_list.append(in_process_ms)
+
+        serve_argv = [sys.executable, shell2py_py, "--serve"]
+        with subprocess.Popen(serve_argv, stderr=subprocess.DEVNULL) as serving:
+            try:
+                while not os.path.exists(socket_path):
+                    time.sleep(0.010)
+
+                for (argv, in_process_ms) in zip(argvs, in_process_ms_list):
+                    client_argv = [sys.executable, client_py] + argv
+                    served_ms = argv_median_ms(client_argv, repeats=repeats)
+
+                    str_argv = " ".join(argv)
+                    print(
+                        "{:16s} {:13.1f}  {:9.1f}".format(
+                            str_argv, in_process_ms, served_ms
+                        )
+                    )
+
+                    record_ms(str_argv + " in_process", ms=in_process_ms)
+                    record_ms(str_argv + " served", ms=served_ms)
+
+            finally:
+                serving.send_signal(signal.SIGINT)
+
+
+def bench_shell2py_batch(counts=(10, 100, 1000), repeats=3):
+    """Show that 'shell2py --batch' pays for 1 Python start, not 1 per Shell line"""
+
+    print()
+    print("shell2py translation of N Shell lines, via 1 '--batch' vs N processes")
+    print("lines  batch_ms  processes_ms (estimated)")
+
+    shlines = ["echo 'Hello, World!'", "grep -anw 'def|jkl'", "tac -", "find -type d"]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        shell2py_py = os.path.join(FILE_DIR, "shell2py.py")
+        process_ms_list = list()
+        for shline in shlines:
+            argv = [sys.executable, shell2py_py] + shlex.split(shline)
+            process_ms = argv_median_ms(argv, repeats=repeats)
+            process_ms_list.append(process_ms)
+
+        for count in counts:
+            script_path = os.path.join(tmp_dir, "script{}.sh".format(count))
+            with open(script_path, "w") as writing:
+                for index in range(count):
+                    writing.write(shlines[index % len(shlines)] + "\n")
+
+            argv = [sys.executable, shell2py_py, "--batch", script_path]
+            batch_ms = argv_median_ms(argv, repeats=repeats)
+
+            processes_ms = sum(
+                process_ms_list[_ % len(process_ms_list)] for _ in range(count)
+            )
+
+            print("{:5d}  {:8.1f}  {:12.1f}".format(count, batch_ms, processes_ms))
+
+            record_ms("{} lines batch".format(count), ms=batch_ms)
+
+
+def bench_py_cache(repeats=9):
+    """Show how much faster 'shell2py VERB' runs when it finds its Python cached"""
+
+    print()
+    print("shell2py translation, with the cache of Python missing vs found")
+    print("argv                                miss_ms  hit_ms")
+
+    argvs = (
+        ["ls", "-1"],
+        ["ls", "-lh"],
+        ["ls", "-1F", "_bench_.py", "__pycache__"],
+        ["tar", "tvf", "dir.tgz", "dir/a"],
+        ["find", "-maxdepth", "1", "-type", "d"],
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        copy_verbs_to(tmp_dir, more_verbs=0)
+
+        shell2py_py = os.path.join(tmp_dir, "shell2py.py")
+        py_cache_dir = os.path.join(tmp_dir, "__pycache__", "shell2py-py")
+
+        for argv in argvs:
+            shell2py_argv = [sys.executable, shell2py_py] + argv
+
+            miss_ms = argv_median_ms(
+                shell2py_argv,
+                repeats=repeats,
+                cwd=tmp_dir,
+                before=lambda: shutil.rmtree(py_cache_dir, ignore_errors=True),
+            )
+            hit_ms = argv_median_ms(shell2py_argv, repeats=repeats, cwd=tmp_dir)
+
+            str_argv = " ".join(argv)
+            print("{:35s} {:7.1f}  {:6.1f}".format(str_argv, miss_ms, hit_ms))
+
+            record_ms(str_argv + " miss", ms=miss_ms)
+            record_ms(str_argv + " hit", ms=hit_ms)
+
+        # Count the Hits and Misses of translating each ArgV twice, in one process
+
+        shutil.rmtree(py_cache_dir, ignore_errors=True)
+
+        counts_py = textwrap.dedent(
+            """
+            import json, sys
+            import _scraps_, shell2py
+            for argv in 2 * json.loads(sys.argv[1]):
+                shell2py.argv__to_reply(["shell2py"] + argv)
+            print(json.dumps(_scraps_.PY_CACHE_COUNTS))
+            """
+        )
+
+        argv = [sys.executable, "-c", counts_py, json.dumps(argvs)]
+        run = subprocess.run(argv, stdout=subprocess.PIPE, cwd=tmp_dir, check=True)
+        counts = json.loads(run.stdout)
+
+        print("counts: {} hits, {} misses".format(counts["hits"], counts["misses"]))
+
+
+def bench_pyc_cache(repeats=9):
+    """Show how much faster each Verb starts when it finds its Code compiled before"""
+
+    print()
+    print("verb startup, with the cache of compiled Code missing vs found")
+    print("argv                     miss_ms  hit_ms  saved_ms")
+
+    argvs = (
+        ["echo", "hi"],
+        ["find", "-maxdepth", "1", "-type", "d"],
+        ["grep", "-anw", "def|jkl"],
+        ["ls", "-1"],
+        ["ls", "-lh"],
+        ["tac", "-"],
+        ["tar", "tvf", "dir.tgz"],
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        copy_verbs_to(tmp_dir, more_verbs=0)
+
+        pyc_cache_dir = os.path.join(tmp_dir, "__pycache__", "shell2py-pyc")
+        with tarfile.open(os.path.join(tmp_dir, "dir.tgz"), "w:gz") as tar:
+            tar.add(os.path.join(tmp_dir, "echo.py"), arcname="dir/echo.py")
+
+        for argv in argvs:
+            verb_argv = [sys.executable, os.path.join(tmp_dir, argv[0] + ".py")]
+            verb_argv.extend(argv[1:])
+
+            miss_ms = argv_median_ms(
+                verb_argv,
+                repeats=repeats,
+                cwd=tmp_dir,
+                before=lambda: shutil.rmtree(pyc_cache_dir, ignore_errors=True),
+            )
+            hit_ms = argv_median_ms(verb_argv, repeats=repeats, cwd=tmp_dir)
+
+            str_argv = " ".join(argv)
+            saved_ms = miss_ms - hit_ms
+
+            record_ms(str_argv + " miss", ms=miss_ms)
+            record_ms(str_argv + " hit", ms=hit_ms)
+
+            print(
+                "{:24s} {:7.1f}  {:6.1f}  {:8.1f}".format(
+                    str_argv, miss_ms, hit_ms, saved_ms
+                )
+            )
+
+
+def bench_py_pick(passes_counts=(1, 2, 4, 8), repeats=9):
+    """Show that picking Def's by 1 Closure costs less than re-picking by each Pass"""
+
+    import ls  # import late, to leave 'sys.modules' small for the other benches
+
+    import _scraps_
+
+    print()
+    print("ls -lh picking Def's, by passes of 'py_pick_lines' vs 1 'py_pick_closure'")
+    print("passes  passes_ms  closure_ms")
+
+    args = ls.parse_ls_args(["ls", "-lh"])
+    argnames = sorted(vars(args).keys())
+    index = _scraps_.module_name__index("ls")
+    (py1, _) = ls.args__to_top_level_ls_py(args)
+
+    def edit(py):
+        return ls.edit_ls_py(py, args=args, argnames=argnames)
+
+    def pick_by_passes(passes):
+        py = py1
+        for _ in range(passes):
+            py = edit(py_pick_lines(py=py, module_py=index.py))
+
+    def pick_by_closure():
+        _scraps_.py_pick_closure(py=py1, index=index, edit=edit)
+
+    for passes in passes_counts:
+        passes_ms = func_median_ms(lambda: pick_by_passes(passes), repeats=repeats)
+        closure_ms = func_median_ms(pick_by_closure, repeats=repeats)
+
+        print("{:6d}  {:9.2f}  {:10.2f}".format(passes, passes_ms, closure_ms))
+
+        record_ms("{} passes".format(passes), ms=passes_ms)
+        record_ms("closure", ms=closure_ms)
+
+
+def bench_py_dedent(repeats=9):
+    """Show that pruning all Guards in 1 pass costs less than 2 passes per Guard"""
+
+    import ls  # import late, to leave 'sys.modules' small for the other benches
+    import tar
+
+    import _scraps_
+
+    print()
+    print("pruning the Guards of a whole module, by passes of 'py_dedent_bool' vs 1")
+    print("module  lines  guards  passes_ms  one_pass_ms")
+
+    ls_args = ls.parse_ls_args(["ls", "-lh"])
+    tar_args = tar.compile_tar_argdoc().parse_args(["-xvkf", "dir.tgz"])
+
+    rows = (
+        ("ls", ls_args, sorted(vars(ls_args).keys()), dict()),
+        ("tar", tar_args, "v k O dict".split(), dict(patterns=tar_args.patterns)),
+    )
+
+    for (name, args, argnames, truthy_by_name) in rows:
+        module_py = _scraps_.module_name__readlines(name)
+
+        def dedent_by_passes():
+            py = module_py
+            for argname in argnames:
+                truthy = bool(vars(args)[argname])
+                py = py_dedent_bool(py, "args.{}".format(argname), truthy)
+            for (guard, truthy) in truthy_by_name.items():
+                py = py_dedent_bool(py, guard, truthy)
+
+        def dedent_by_one_pass():
+            _scraps_.py_dedent_args(module_py, args, argnames, **truthy_by_name)
+
+        passes_ms = func_median_ms(dedent_by_passes, repeats=repeats)
+        one_pass_ms = func_median_ms(dedent_by_one_pass, repeats=repeats)
+
+        lines = len(module_py.splitlines())
+        guards = len(argnames) + len(truthy_by_name)
+        print(
+            "{:6s}  {:5d}  {:6d}  {:9.2f}  {:11.2f}".format(
+                name, lines, guards, passes_ms, one_pass_ms
+            )
+        )
+
+        record_ms(name + " passes", ms=passes_ms)
+        record_ms(name + " one_pass", ms=one_pass_ms)
+
+
+def bench_py_index(repeats=9):
+    """Show how much faster Python gets written, when the Index of its Source is kept"""
+
+    print()
+    print("shell2py translation, with the index of the source missing vs found")
+    print("argv                  miss_ms  hit_ms")
+
+    argvs = (["ls", "-1"], ["ls", "-lh"], ["tac", "-"], ["tar", "tvf", "dir.tgz"])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        copy_verbs_to(tmp_dir, more_verbs=0)
+
+        shell2py_py = os.path.join(tmp_dir, "shell2py.py")
+        py_cache_dir = os.path.join(tmp_dir, "__pycache__", "shell2py-py")
+        index_dir = os.path.join(tmp_dir, "__pycache__", "shell2py-index")
+
+        def rmtree_py_cache_dir():
+            shutil.rmtree(py_cache_dir, ignore_errors=True)
+
+        def rmtree_both_dirs():
+            shutil.rmtree(py_cache_dir, ignore_errors=True)
+            shutil.rmtree(index_dir, ignore_errors=True)
+
+        for argv in argvs:
+            shell2py_argv = [sys.executable, shell2py_py] + argv
+
+            miss_ms = argv_median_ms(
+                shell2py_argv, repeats=repeats, cwd=tmp_dir, before=rmtree_both_dirs
+            )
+            hit_ms = argv_median_ms(
+                shell2py_argv, repeats=repeats, cwd=tmp_dir, before=rmtree_py_cache_dir
+            )
+
+            str_argv = " ".join(argv)
+            print("{:21s} {:7.1f}  {:6.1f}".format(str_argv, miss_ms, hit_ms))
+
+            record_ms(str_argv + " miss", ms=miss_ms)
+            record_ms(str_argv + " hit", ms=hit_ms)
+
+
+#
+# Pick and prune Py in the older ways, kept only to time against the newer ways
+#
+
+
+def py_pick_lines(py, module_py):
+    """Insert the next deeper layer of Def's mentioned by the Py"""
+
+    # Keep the last Paragraph of Code
+    # (wrong when anchored by more, less, or different source lines)
+
+    paras = _scraps_.split_paragraphs(py.splitlines())
+    core_py = "\n".join(paras[-1])
+
+    # Add Defs of each Name mentioned by Py
+    # (wrong for Mentions that don't mean Call Def:  Strings, Comments, etc)
+
+    names = sorted(set(re.findall(r"[A-Z_a-z][0-9A-Z_a-z]*", string=py)))
+    def_lines = _py_pick_def_lines(names, module_py=module_py)
+    defs_py = _py_pick_defs(def_lines, module_py=module_py)
+
+    got_py = defs_py + "\n\n\n" + core_py
+
+    return got_py
+
+
+def _py_pick_defs(def_lines, module_py):
+    """Pick out each Def Line and its Body, as ordered by Module Py"""
+
+    def_lines_set = set(def_lines)
+    inlines = module_py.splitlines()
+
+    outlines = list()
+    for (index, inline) in enumerate(inlines):
+        if inline in def_lines_set:
+
+            if True:  # TODO: more elegant tie to comments before 'def' func
+                if inline == "def stderr_print(*args, **kwargs):":
+                    outlines.append(
+                        "# deffed in many files  # missing from docs.python.org"
+                    )
+
+            outlines.append(inline)
+
+            # Copy Lines of the Body till next Outdent
+            # ( wrong for Comments, Lines inside Multi-Line Strings, etc )
+
+            for inline in inlines[(index + 1) :]:
+                if inline and not inline.startswith(" "):
+
+                    break
+
+                outlines.append(inline)
+
+                continue
+
+    chars = "\n".join(outlines).strip()
+
+    return chars
+
+
+def _py_pick_def_lines(names, module_py):
+    """Pick top-level Def Lines from Module-Py that match Mentions by Py"""
+
+    # Pick out Top-Level Def Lines
+    # but go wrong over Comments, Multi-Line Strings, etc
+
+    def_line_by_name = dict()
+    for line in module_py.splitlines():
+        words = line.split()
+        if words and (words[0] == "def"):
+            deffed_name = words[1].split("(")[0]
+
+            assert deffed_name not in def_line_by_name, deffed_name
+            def_line_by_name[deffed_name] = line
+
+    # Pick out Top-Level Def Lines that got a Mention
+
+    picked_lines = list()
+    for name in names:
+        if name in def_line_by_name:
+            def_line = def_line_by_name[name]
+
+            picked_lines.append(def_line)
+
+    return picked_lines
+
+
+def py_dedent_bool(py, name, truthy):
+    """Keep or drop Code guarded by this Name, and drop the Name if falsey"""
+
+    py1 = py
+
+    if_yes_line = "if {}:".format(name)
+    py1 = py_dedent(py1, line=if_yes_line, truthy=truthy)
+
+    if_no_line = "if not {}:".format(name)
+    py1 = py_dedent(py1, line=if_no_line, truthy=(not truthy))
+
+    if not truthy:
+        py1 = py1.replace(", {name})".format(name=name), ")")
+        py1 = py1.replace("({name})".format(name=name), "()")
+
+    return py1
+
+
+def py_dedent(py, line, truthy):  # noqa Flake8 C901 too complex (11)
+    """Keep or drop Code guarded by copies of this Guard Line, and drop the copies"""
+
+    # Visit each Line of Py
+
+    inlines = py.splitlines()
+
+    outlines = list()
+    skip_index = 0
+    for (index, inline) in enumerate(inlines):
+
+        # Don't revisit lines already found after finding the last Guard Line
+
+        if index < skip_index:
+
+            continue
+
+        # Keep lines between Guard Line's
+
+        if inline.strip() != line:
+
+            outlines.append(inline)
+
+        else:
+
+            # Drop this Guard Line
+
+            (top_dent, _) = _scraps_.str_splitdent(inline)
+
+            skip_index = index
+            skip_index += 1
+
+            # Loop till next Outdent
+
+            for (sub_index, inline) in enumerate(inlines[(index + 1) :]):
+
+                (dent, tail) = _scraps_.str_splitdent(inline)
+                # wrong inside Multi-Line Strings, wrong for indented Comments, etc
+
+                if len(dent) <= len(top_dent):
+                    if inline:
+
+                        break
+
+                # Shift left by one level of indentation
+
+                outline = inline
+                if inline:
+                    assert inline.startswith(_scraps_.DENT + top_dent), repr(inline)
+                    outline = inline[len(_scraps_.DENT) :]
+
+                # Keep the Lines after the Guard Line, if Guard truthy
+                # Drop only the non-blank Lines after the Guard Line, if Guard falsey
+
+                if truthy or inline:
+                    skip_index = index + 1 + sub_index + 1
+                    if truthy:
+                        outlines.append(outline)
+
+            # Drop the trailing blank lines if Falsey Guard
+
+            if not truthy:
+                while outlines and not outlines[-1]:
+                    outlines = outlines[:-1]
+
+    # Return chars, not lines
+
+    chars = "\n".join(outlines).strip()
+
+    return chars
+
+
+#
+# Time each Verb, at writing its Python, and at running on inputs of growing size
+#
+
+
+def bench_verb_examples(repeats=5):
+    """Time the writing of Python for each Example in the Doc of each Verb"""
+
+    print()
+    print("argv__to_*_py for each example in the doc of each verb")
+    print("argv                                               ms")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        write_bench_inputs(tmp_dir, count=10)
+
+        with_cwd = os.getcwd()
+        os.chdir(tmp_dir)
+        try:
+            for (verb, argv) in list_verb_examples():
+                argv__to_py = verb_argv__to_py(verb)
+                ms = argv__to_py_median_ms(argv__to_py, argv=argv, repeats=repeats)
+
+                str_argv = _scraps_.shlex_join(argv)
+                if ms is None:
+                    print("{:48s}  {}".format(str_argv, "skipped"))
+                else:
+                    print("{:48s} {:5.2f}".format(str_argv, ms))
+                    record_ms(str_argv, ms=ms)
+
+        finally:
+            os.chdir(with_cwd)
+
+
+def list_verb_examples():
+    """Pick out the Verb ArgV's from the Examples in the Doc of each Verb"""
+
+    examples = list()
+    for (verb, module) in sorted(verb_modules().items()):
+        doc = module.__doc__
+        if "\nexamples:\n" not in doc:
+
+            continue
+
+        # Split each Example into Shell Commands, and keep those of this Verb
+
+        lines = doc[doc.index("\nexamples:\n") :].splitlines()[2:]
+        for line in lines:
+            lex = shlex.shlex(line, posix=True, punctuation_chars=True)
+            lex.whitespace_split = True
+            words = list(lex) + [";"]
+
+            argv = list()
+            for word in words:
+                if word and all((_ in lex.punctuation_chars) for _ in word):
+                    if argv and (argv[0] in (verb, verb + ".py")):
+                        examples.append((verb, [verb] + argv[1:]))
+                    argv = list()
+                else:
+                    argv.append(word)
+
+    return examples
+
+
+@functools.lru_cache(maxsize=None)
+def verb_modules():
+    """Import each Verb that writes Python, and index them by Verb"""
+
+    import shell2py  # import late, to leave 'sys.modules' small for the other benches
+
+    module_by_verb = dict()
+
+    module_name_by_verb = shell2py.load_verbs_manifest()
+    for (verb, name) in module_name_by_verb.items():
+        module = importlib.import_module(name)
+        if hasattr(module, "argv__to_{}_py".format(verb)):
+            module_by_verb[verb] = module
+
+    return module_by_verb
+
+
+def verb_argv__to_py(verb):
+    """Find the Func that writes the Python for the ArgV of a Verb"""
+
+    module = verb_modules()[verb]
+    argv__to_py = getattr(module, "argv__to_{}_py".format(verb))
+
+    return argv__to_py
+
+
+def argv__to_py_median_ms(argv__to_py, argv, repeats):
+    """Time the writing of Python for an ArgV, else return None if it quits"""
+
+    def func():
+        with contextlib.redirect_stdout(io.StringIO()):
+            with contextlib.redirect_stderr(io.StringIO()):
+                argv__to_py(argv)
+
+    try:
+        ms = func_median_ms(func, repeats=repeats)
+    except SystemExit:
+        return None  # such as '--help', or rejected
+    except OSError:
+        return None  # such as a Top not found
+
+    return ms
+
+
+def bench_verb_runs(counts=(100, 1000, 10000), repeats=3):
+    """Time 'bin/*.py' over Dirs, Files, and Tgz's of more and more Lines and Files"""
+
+    print()
+    print("bin/*.py run over inputs of more and more lines and files")
+    print("argv                             count      ms")
+
+    argvs = (
+        (["ls.py", "-1", "flat"], None),
+        (["ls.py", "-lh", "flat"], None),
+        (["ls.py", "flat"], None),
+        (["find.py", "tree"], None),
+        (["find.py", "tree", "-type", "d"], None),
+        (["grep.py", "-anw", "def|jkl"], "lines.txt"),
+        (["tac.py", "lines.txt"], None),
+        (["tar.py", "tf", "tree.tgz"], None),
+        (["tar.py", "tvf", "tree.tgz"], None),
+    )
+
+    for count in counts:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            write_bench_inputs(tmp_dir, count=count)
+
+            for (argv, stdin_name) in argvs:
+                verb_argv = [sys.executable, os.path.join(FILE_DIR, argv[0])]
+                verb_argv.extend(argv[1:])
+
+                stdin_path = None
+                if stdin_name:
+                    stdin_path = os.path.join(tmp_dir, stdin_name)
+
+                ms = argv_median_ms(
+                    verb_argv, repeats=repeats, cwd=tmp_dir, stdin_path=stdin_path
+                )
+
+                str_argv = " ".join(argv)
+                if stdin_name:
+                    str_argv += " <" + stdin_name
+
+                print("{:32s} {:5d}  {:6.1f}".format(str_argv, count, ms))
+                record_ms("{} ({})".format(str_argv, count), ms=ms)
+
+
+def write_bench_inputs(tmp_dir, count):
+    """Write a flat Dir, a Tree of Dirs, a Tgz of the Tree, and Lines, all of Count"""
+
+    # Write a flat Dir of Count Files, and a Tree of Count Files, 100 per Dir
+
+    flat_dir = os.path.join(tmp_dir, "flat")
+    write_bench_flat_dir(flat_dir, count=count)
+
+    tree_dir = os.path.join(tmp_dir, "tree")
+    for index in range(count):
+        sub_dir = os.path.join(tree_dir, "d{:03d}".format(index // 100))
+        os.makedirs(sub_dir, exist_ok=True)
+        with open(os.path.join(sub_dir, "f{:05d}.txt".format(index)), "w"):
+            pass
+
+    with tarfile.open(os.path.join(tmp_dir, "tree.tgz"), "w:gz") as tar:
+        tar.add(tree_dir, arcname="tree")
+
+    # Write Count Lines, and the inputs of the Examples of the Verbs
+
+    words = "abc def ghi jkl mno pqr stu vwx".split()
+    with open(os.path.join(tmp_dir, "lines.txt"), "w") as writing:
+        for index in range(count):
+            writing.write("{} {}\n".format(index, words[index % len(words)]))
+
+    with open(os.path.join(tmp_dir, "file"), "w") as writing:
+        writing.write("\n".join(words) + "\n")
+
+    with tarfile.open(os.path.join(tmp_dir, "dir.tgz"), "w:gz") as tar:
+        tar.add(flat_dir, arcname="dir")
+
+
+def write_bench_flat_dir(flat_dir, count):
+    """Write a Dir of Count empty Files"""
+
+    os.makedirs(flat_dir)
+    for index in range(count):
+        with open(os.path.join(flat_dir, "f{:05d}.txt".format(index)), "w"):
+            pass
+
+
+#
+# Time the Rows of 'ls -l', over more and more Names, with and without caches
+#
+
+
+def bench_ls_rows(counts=(1000, 10000, 100000, 1000000), repeats=1):
+    """Show that caching Users, Groups, Modes, and Stamps keeps each 'ls -l' Row cheap"""
+
+    import ls  # import late, to leave 'sys.modules' small for the other benches
+
+    print()
+    print("ls -lh rows built from synthetic stats, without vs with caches")
+    print("count    uncached_ms  cached_ms")
+
+    args = ls.parse_ls_args(["ls", "-lh"])
+    ls_caches = (
+        ls.os_gid_uid,
+        ls.st_mode_filemode,
+        ls.st_uid_format,
+        ls.st_gid_format,
+        ls.st_mtime_minute_format,
+        ls.now_year,
+    )
+
+    def build_rows(items):
+        for cache in ls_caches:
+            cache.cache_clear()
+        for item in items:
+            ls.stats_item_row(item, args=args)
+
+    for count in counts:
+        items = list(synthetic_ls_items(count))
+
+        with ls_caches_bypassed(ls, caches=ls_caches):
+            uncached_ms = func_median_ms(lambda: build_rows(items), repeats=repeats)
+        cached_ms = func_median_ms(lambda: build_rows(items), repeats=repeats)
+
+        print("{:7d}  {:11.1f}  {:9.1f}".format(count, uncached_ms, cached_ms))
+
+        record_ms("{} uncached".format(count), ms=uncached_ms)
+        record_ms("{} cached".format(count), ms=cached_ms)
+
+
+def bench_ls_ndjson(counts=(10000, 100000), repeats=3):
+    """Show that 'ls.py -l --ndjson -f' holds flat Memory as Rows grow, unlike '-l'"""
+
+    print()
+    print("ls.py -l rows padded into columns, vs rows printed one by one")
+    print("count    argv                first_row_ms  all_rows_ms  maxrss_kib")
+
+    ls_py = os.path.join(FILE_DIR, "ls.py")
+
+    shargs_list = ("-l", "-l --ndjson", "-l --ndjson -f")
+
+    for count in counts:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            write_bench_flat_dir(os.path.join(tmp_dir, "flat"), count=count)
+
+            for shargs in shargs_list:
+                argv = [sys.executable, ls_py] + shargs.split() + ["flat"]
+
+                triples = list()
+                for _ in range(repeats):
+                    triple = argv_first_row_ms(argv, cwd=tmp_dir)
+                    triples.append(triple)
+
+                first_row_ms = statistics.median(_[0] for _ in triples)
+                all_rows_ms = statistics.median(_[1] for _ in triples)
+                maxrss_kib = max(_[-1] for _ in triples)
+
+                print(
+                    "{:7d}  {:18}  {:12.1f}  {:11.1f}  {:10d}".format(
+                        count, shargs, first_row_ms, all_rows_ms, maxrss_kib
+                    )
+                )
+
+                record_ms("{} {} first row".format(count, shargs), ms=first_row_ms)
+                record_ms("{} {} all rows".format(count, shargs), ms=all_rows_ms)
+
+
+def bench_ls_lookahead(counts=(10000, 100000), lookaheads=(None, 1000, 0)):
+    """Show that 'ls.py -l --lookahead N -f' prints sooner, and holds less"""
+
+    print()
+    print("ls.py -l -f rows padded all at once, vs padded as wide as the first N rows")
+    print("count    lookahead  first_row_ms  all_rows_ms  maxrss_kib")
+
+    ls_py = os.path.join(FILE_DIR, "ls.py")
+
+    for count in counts:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            write_bench_flat_dir(os.path.join(tmp_dir, "flat"), count=count)
+
+            for lookahead in lookaheads:
+                argv = [sys.executable, ls_py, "-l", "-f", "flat"]
+                if lookahead is not None:
+                    argv[-1:-1] = ["--lookahead", str(lookahead)]
+
+                (first_row_ms, all_rows_ms, maxrss_kib) = argv_first_row_ms(
+                    argv, cwd=tmp_dir
+                )
+
+                print(
+                    "{:7d}  {:>9}  {:12.1f}  {:11.1f}  {:10d}".format(
+                        count, str(lookahead), first_row_ms, all_rows_ms, maxrss_kib
+                    )
+                )
+
+                key = "{} lookahead {} first row".format(count, lookahead)
+                record_ms(key, ms=first_row_ms)
+
+
+def bench_ls_columns(counts=(1000, 10000, 100000), repeats=3):
+    """Show that packing Names into Columns costs about as much per Name, at any count"""
+
+    import ls  # import late, to leave 'sys.modules' small for the other benches
+
+    print()
+    print("ls -C packing more and more names into 80 columns")
+    print("count    ms  us_per_name")
+
+    for count in counts:
+        names = list("f{}.txt".format(10 ** (_ % 7) + _) for _ in range(count))
+
+        def pack():
+            ls.pack_cells_in_columns(names, tty_columns=80, sep="  ")
+
+        ms = func_median_ms(pack, repeats=repeats)
+
+        print("{:6d}  {:5.1f}  {:11.2f}".format(count, ms, 1000 * ms / count))
+        record_ms("{} names".format(count), ms=ms)
+
+
+class SyntheticEntry:
+    """Stand in for a 'os.DirEntry' of a Dir too large to write out"""
+
+    def __init__(self, stat_result):
+        self.stat_result = stat_result
+
+    def is_dir(self):
+        return stat.S_ISDIR(self.stat_result.st_mode)
+
+    def stat(self):
+        return self.stat_result
+
+
+def synthetic_ls_items(count):
+    """Yield Count Pairs of Name and Entry, of a few Users, Modes, and Sizes"""
+
+    (gid, uid) = (os.getgid(), os.getuid())
+    modes = (0o100644, 0o100755, 0o040755, 0o100600)
+    now = int(time.time())
+
+    for index in range(count):
+        st_mode = modes[index % len(modes)]
+        st_uid = 0 if (index % 10) else uid
+        st_gid = 0 if (index % 10) else gid
+        st_size = (index * 7919) % (1 << 30)
+        st_mtime = now - (index * 61) % (400 * 24 * 60 * 60)  # over 400 days
+
+        fields = (st_mode, index, 0, 1, st_uid, st_gid, st_size, now, st_mtime, now)
+        entry = SyntheticEntry(os.stat_result(fields))
+
+        yield ("f{:07d}.txt".format(index), entry)
+
+
+@contextlib.contextmanager
+def ls_caches_bypassed(ls, caches):
+    """Call the uncached Funcs of the Ls Module, till the Context exits"""
+
+    for cache in caches:
+        setattr(ls, cache.__name__, cache.__wrapped__)
+    try:
+        yield
+    finally:
+        for cache in caches:
+            setattr(ls, cache.__name__, cache)
+
+
+#
+# Time 'find.py' over a Tree of more and more Files, beside the Find of the Shell
+#
+
+
+def bench_find_walk(counts=(10000, 100000, 1000000), repeats=1):
+    """Show how far 'find.py' lags the Find of the Shell, over the same Tree"""
+
+    print()
+    print("find.py vs the find of the shell, over a tree of 100 files per dir")
+    print("count      py_ms  jobs_8_ms  shell_ms  py_vs_shell")
+
+    shell_find = shutil.which("find")
+
+    for count in counts:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            write_bench_tree(os.path.join(tmp_dir, "tree"), count=count)
+
+            py_argv = [sys.executable, os.path.join(FILE_DIR, "find.py"), "tree"]
+            py_ms = argv_median_ms(py_argv, repeats=repeats, cwd=tmp_dir)
+            record_ms("{} find.py".format(count), ms=py_ms)
+
+            jobs_argv = py_argv + ["--jobs", "8"]
+            jobs_ms = argv_median_ms(jobs_argv, repeats=repeats, cwd=tmp_dir)
+            record_ms("{} find.py --jobs 8".format(count), ms=jobs_ms)
+
+            if not shell_find:
+                print(
+                    "{:7d}  {:9.1f}  {:9.1f}  {:>8s}".format(
+                        count, py_ms, jobs_ms, "skipped"
+                    )
+                )
+
+                continue
+
+            shell_argv = [shell_find, "tree"]
+            shell_ms = argv_median_ms(shell_argv, repeats=repeats, cwd=tmp_dir)
+
+            print(
+                "{:7d}  {:9.1f}  {:9.1f}  {:8.1f}  {:10.1f}x".format(
+                    count, py_ms, jobs_ms, shell_ms, py_ms / shell_ms
+                )
+            )
+
+
+def write_bench_tree(tree_dir, count):
+    """Write a Tree of Count Files, 100 per Dir, 100 Dirs per Dir"""
+
+    for index in range(count):
+        sub_dir = os.path.join(
+            tree_dir, "d{:03d}".format(index // 10000), "d{:05d}".format(index // 100)
+        )
+        if not (index % 100):
+            os.makedirs(sub_dir)
+
+        with open(os.path.join(sub_dir, "f{:07d}.txt".format(index)), "w"):
+            pass
+
+
+#
+# Keep the results, and compare them with results kept before
+#
+
+
+def record_ms(row, ms):
+    """Keep the median milliseconds of a row of the calling bench"""
+
+    f = inspect.currentframe()
+    bench = f.f_back.f_code.co_name[len("bench_") :]
+
+    ms_by_row = RESULTS.setdefault(bench, dict())
+    ms_by_row[row] = round(ms, 3)
+
+
+def exit_if_slower(baseline, slack):
+    """Compare the results with a baseline, and exit 1 if any row got slower"""
+
+    try:
+        with open(baseline) as reading:
+            baseline_results = json.load(reading)
+    except FileNotFoundError:
+        print()
+        print("no baseline at {!r}, so nothing compared".format(baseline))
+
+        return
+
+    # Compare each row found in both
+
+    slowers = list()
+    for (bench, ms_by_row) in sorted(RESULTS.items()):
+        baseline_ms_by_row = baseline_results.get(bench, dict())
+        for (row, ms) in sorted(ms_by_row.items()):
+            if row in baseline_ms_by_row:
+                baseline_ms = baseline_ms_by_row[row]
+                if (ms - baseline_ms) >= 1:
+                    if ms > (baseline_ms * (1 + slack / 100)):
+                        slowers.append((bench, row, baseline_ms, ms))
+
+    # Exit 1 if any row got slower
+
+    print()
+    if not slowers:
+        print("no rows slower than in {!r}".format(baseline))
+
+        return
+
+    print("rows slower than in {!r}".format(baseline))
+    for (bench, row, baseline_ms, ms) in slowers:
+        pct = 100 * (ms - baseline_ms) / baseline_ms
+        print(
+            "  {}: {}: {:.1f} ms -> {:.1f} ms (+{:.0f}%)".format(
+                bench, row, baseline_ms, ms, pct
+            )
+        )
+
+    sys.exit(1)
+
+
+#
+# Time the running of Python
+#
+
+
+def copy_verbs_to(tmp_dir, more_verbs):
+    """Copy the Py near here into a Dir, and add more Verbs, and list the Verbs"""
+
+    for filename in sorted(os.listdir(FILE_DIR)):
+        if filename.endswith(".py"):
+            shutil.copy(os.path.join(FILE_DIR, filename), tmp_dir)
+
+    with open(os.path.join(FILE_DIR, "dig.py")) as reading:
+        dig_py = reading.read()
+
+    for index in range(more_verbs):
+        verb = "dig{}".format(index)
+        with open(os.path.join(tmp_dir, verb + ".py"), "w") as writing:
+            writing.write(dig_py.replace("dig", verb))
+
+    filenames = sorted(os.listdir(tmp_dir))
+    module_names = list(os.path.splitext(_)[0] for _ in filenames)
+    verbs = list(_ for _ in module_names if not _.startswith("_"))
+    verbs = list(_ for _ in verbs if _ != "shell2py")
+
+    return verbs
+
+
+def argv_median_ms(argv, repeats, cwd=None, before=None, stdin_path=None):
+    """Run an ArgV once to warm the caches, then again to count median milliseconds"""
+
+    def run():
+        with open(stdin_path if stdin_path else os.devnull, "rb") as stdin:
+            kwargs = dict(stdin=stdin, stdout=subprocess.DEVNULL, cwd=cwd)
+            subprocess.run(argv, **kwargs, check=True)
+
+    run()
+
+    secs = list()
+    for _ in range(repeats):
+        if before:
+            before()
+
+        t0 = time.perf_counter()
+        run()
+        t1 = time.perf_counter()
+        secs.append(t1 - t0)
+
+    ms = 1000 * statistics.median(secs)
+
+    return ms
+
+
+def argv_first_row_ms(argv, cwd):
+    """Run an ArgV once, to time its first Row, its last Row, and its peak Memory"""
+
+    first_row_ms = None
+
+    t0 = time.perf_counter()
+    with subprocess.Popen(argv, stdout=subprocess.PIPE, cwd=cwd) as proc:
+        for line in proc.stdout:
+            if first_row_ms is None:
+                if not line.startswith(b"total "):  # not the 'total .' line of '-l'
+                    first_row_ms = 1000 * (time.perf_counter() - t0)
+
+        (_, _, rusage) = os.wait4(proc.pid, 0)  # reap it here, to get its Rusage
+        all_rows_ms = 1000 * (time.perf_counter() - t0)
+
+    maxrss_kib = rusage.ru_maxrss  # KiB at Linux, but Bytes at Mac
+
+    return (first_row_ms, all_rows_ms, maxrss_kib)
+
+
+def func_median_ms(func, repeats):
+    """Call a Func once to warm the caches, then again to count median milliseconds"""
+
+    func()
+
+    secs = list()
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        func()
+        t1 = time.perf_counter()
+        secs.append(t1 - t0)
+
+    ms = 1000 * statistics.median(secs)
+
+    return ms
+
+
+if __name__ == "__main__":
+    main()
+
+
+# copied by: git clone https://github.com/pelavarre/shell2py.git
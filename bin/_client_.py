@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+"""
+Ask a running 'shell2py --serve' to translate, else translate in-process
+
+Import just a little, to start fast, when a Server is running
+"""
+
+import json
+import os
+import socket
+import sys
+
+
+ENV_NAMES = ("COLUMNS", "LINES")  # the Env Vars that can change how we translate
+
+
+def main():
+
+    argv = sys.argv
+
+    # Ask the Server to translate, if it's running and fresh
+
+    reply = None
+    if argv[1:2] not in (["--serve"], ["--batch"]):
+        reply = call_shell2py_server(argv)
+
+    if reply is not None:
+        sys.stdout.write(reply["stdout"])
+        sys.stderr.write(reply["stderr"])
+        sys.exit(reply["returncode"])
+
+    # Else translate in-process
+
+    import shell2py  # import late, to start fast when served
+
+    shell2py.main()
+
+
+def call_shell2py_server(argv):
+    """Ask the Shell2Py Server to translate an ArgV, else return None"""
+
+    socket_path = shell2py_socket_path()
+    if not (socket_path and os.path.exists(socket_path)):
+        return None
+
+    try:
+        request = dict(argv=argv, cwd=os.getcwd(), env=shell2py_client_env())
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(json.dumps(request).encode() + b"\n")
+            client.shutdown(socket.SHUT_WR)
+            data = socket_recv_till_eof(client)
+    except OSError:
+        return None  # such as a Server no longer running
+
+    try:
+        reply = json.loads(data)
+    except ValueError:
+        return None  # such as a Server quitting mid-reply
+
+    if reply.get("stale"):
+        return None
+
+    return reply
+
+
+def shell2py_client_env():
+    """Pick out the Env Vars for the Server to use, while translating for us"""
+
+    env = dict((_, os.environ[_]) for _ in ENV_NAMES if _ in os.environ)
+
+    # Say how big our Terminal is, else the Server wraps Help to fit its own
+
+    try:
+        size = os.get_terminal_size(sys.__stdout__.fileno())
+    except (AttributeError, OSError, ValueError):
+        size = os.terminal_size((80, 24))  # the same fallback as 'shutil'
+
+    env.setdefault("COLUMNS", str(size.columns))
+    env.setdefault("LINES", str(size.lines))
+
+    return env
+
+
+def shell2py_socket_path():
+    """Name the Unix Socket of the Shell2Py Server, else None if the Path is too long"""
+
+    file_dir = os.path.dirname(os.path.abspath(__file__))
+    socket_path = os.path.join(file_dir, "__pycache__", "shell2py.sock")
+
+    if len(os.fsencode(socket_path)) >= 100:  # Linux allows 107 bytes, Mac 103
+        return None
+
+    return socket_path
+
+
+def socket_recv_till_eof(sock):
+    """Read Bytes from a Socket till the far end shuts down its writes"""
+
+    chunks = list()
+    while True:
+        chunk = sock.recv(0x10000)
+        if not chunk:
+
+            break
+
+        chunks.append(chunk)
+
+    data = b"".join(chunks)
+
+    return data
+
+
+if __name__ == "__main__":
+    main()
+
+
+# copied by: git clone https://github.com/pelavarre/shell2py.git
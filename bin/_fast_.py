@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+"""
+usage: _fast_.py [-h] [MAKEFILE]
+
+diff what the Python of 'shell2py --fast' prints, with what the Py that teaches prints
+
+positional arguments:
+  MAKEFILE    the file of 'make go' cases to try (default: Makefile)
+
+optional arguments:
+  -h, --help  show this help message and exit
+
+quirks:
+  tries each 'bin/shell2py VERB ...' line of the Makefile, when not piped nor redirected
+  tries more lines after those, to take each path of 'grep', 'tac', and 'ls --fast'
+  runs the Python in the Dir of the Makefile, with the same Bytes of Stdin each time
+  gives the Python more than 64 KiB of Stdin, to read past the first of the chunks
+  runs no Python when 'shell2py --fast' writes the same Python as 'shell2py'
+  shows each diff, and exits 1 when any output differs
+
+examples:
+  bin/_fast_.py  # diff over the 'make go' cases
+  bin/_fast_.py Makefile  # same deal, but say which Makefile
+"""
+
+import difflib
+import os
+import subprocess
+import sys
+
+import _scraps_
+
+import shell2py
+
+
+FILE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+GREP_FILE_BYTES = b"abc\ndef ghi\njklmno\npqr stu\nvwx"  # the 'make go_grep' File
+
+STDIN_BYTES = 4096 * (GREP_FILE_BYTES + b"\n") + GREP_FILE_BYTES  # 124 KiB
+
+FAST_SHLINES = (  # lines that take each '--fast' path, tried after the Makefile's
+    "bin/shell2py grep -a 'def|jkl|pqr'",
+    "bin/shell2py grep -an 'def|jkl|pqr'",
+    "bin/shell2py tac -",
+    "bin/shell2py ls -1 -f",
+    "bin/shell2py ls -1 -f bin",
+    "bin/shell2py find -maxdepth 2",  # same Python, as Find has no '--fast'
+)
+
+
+def main():
+
+    args = parse_fast_args(sys.argv)
+
+    makefile = args.makefile
+    cwd = os.path.dirname(os.path.abspath(makefile))
+
+    # Diff each case in turn
+
+    tries = 0
+    misses = 0
+    shlines = makefile_shell2py_lines(makefile) + list(FAST_SHLINES)
+    for shline in shlines:
+        tries += 1
+
+        diff_lines = shline_fast_diff_lines(shline, cwd=cwd)
+        if diff_lines is None:
+            print("{:11s}  {}".format("same py", shline))
+        elif not diff_lines:
+            print("{:11s}  {}".format("same output", shline))
+        else:
+            misses += 1
+            print("{:11s}  {}".format("DIFFERENT", shline))
+            for line in diff_lines:
+                print(line)
+
+    # Exit nonzero if any output differs
+
+    if misses:
+        sys.stdout.flush()
+        sys.stderr.write("_fast_.py: {} of {} outputs differ\n".format(misses, tries))
+
+        sys.exit(1)
+
+
+def parse_fast_args(argv):
+    """Parse the ArgV of Fast, else print some Help and quit"""
+
+    parser = _scraps_.compile_argdoc(epi="quirks:")
+
+    parser.add_argument(
+        "makefile",
+        metavar="MAKEFILE",
+        nargs="?",
+        default="Makefile",
+        help="the file of 'make go' cases to try (default: Makefile)",
+    )
+
+    _scraps_.exit_unless_doc_eq(parser)
+
+    args = parser.parse_args(argv[1:])
+
+    return args
+
+
+def makefile_shell2py_lines(makefile):
+    """Pick out the Shell Lines that call Shell2Py with a Verb, and nothing more"""
+
+    with open(makefile) as reading:
+        makelines = reading.read().splitlines()
+
+    shlines = list()
+    for makeline in makelines:
+        shline = makeline.strip()
+        words = shell2py.shlex_split_simple_else_none(shline)
+        if words and (words[0] == "bin/shell2py") and words[1:]:
+            if not words[1].startswith("-"):  # such as '--batch', or '--help'
+                shlines.append(shline)
+
+    return shlines
+
+
+def shline_fast_diff_lines(shline, cwd):
+    """Diff the Outputs of the two Pythons, else return None if the Python is same"""
+
+    words = shell2py.shlex_split_simple_else_none(shline)
+    argv = [sys.executable, os.path.join(FILE_DIR, "shell2py.py")] + words[1:]
+    fast_argv = argv[:2] + ["--fast"] + argv[2:]
+
+    # Write the Python both ways
+
+    run = subprocess.run(argv, stdin=subprocess.DEVNULL, capture_output=True, cwd=cwd)
+    fast_run = subprocess.run(
+        fast_argv, stdin=subprocess.DEVNULL, capture_output=True, cwd=cwd
+    )
+
+    if (fast_run.returncode, fast_run.stdout) == (run.returncode, run.stdout):
+        return None
+
+    # Run the Python both ways, with the same Stdin
+
+    reports = list()
+    for got in (run, fast_run):
+        py_argv = [sys.executable, "-c", got.stdout.decode()]
+        py_run = subprocess.run(
+            py_argv, input=STDIN_BYTES, capture_output=True, cwd=cwd
+        )
+
+        report = py_run.stdout + py_run.stderr
+        report += "+ exit {}\n".format(py_run.returncode).encode()
+        reports.append(report)
+
+    # Diff the Outputs
+
+    (report, fast_report) = reports
+    diff_lines = list(
+        difflib.unified_diff(
+            a=report.decode(errors="replace").splitlines(),
+            b=fast_report.decode(errors="replace").splitlines(),
+            fromfile="shell2py",
+            tofile="shell2py --fast",
+            lineterm="",
+        )
+    )
+
+    return diff_lines
+
+
+if __name__ == "__main__":
+    main()
+
+
+# copied by: git clone https://github.com/pelavarre/shell2py.git
@@ -8,7 +8,12 @@ import argparse
 import ast
 import contextlib
 import difflib
+import functools
+import hashlib
+import importlib.util
 import inspect
+import json
+import marshal
 import os
 import pdb
 import re
@@ -30,6 +35,8 @@ def b():
 def main():
 
     _try_st_size_format_()
+    _try_py_dedent_guards_()
+    _try_argdocs_()
 
     sys.stderr.write("_scraps_.py: tests passed\n")
 
@@ -84,6 +91,52 @@ def _try_st_size_format_():
         print(st_size, fresh)
 
 
+def _try_py_dedent_guards_():
+
+    py = textwrap.dedent(
+        """
+        if yes:
+            a = 1
+
+        if not yes:
+            b = 2
+
+        c = '''
+        if yes:
+        '''
+        """
+    ).strip()
+
+    want = "a = 1\n\nc = '''\nif yes:\n'''"
+    got = py_dedent_guards(py, truthy_by_guard=dict(yes=True))
+    _assert_eq_(want, got=got)
+
+    py = "if yes:\n    c = '''\n    d\n    '''"
+    try:
+        py_dedent_guards(py, truthy_by_guard=dict(yes=True))
+        raise RuntimeError("shifted a Multi-Line String beneath a Guard")
+    except AssertionError:
+        pass
+
+
+def _try_argdocs_():
+    """Check each Verb's Doc against its Parser, even if checked before"""
+
+    file_dir = os.path.dirname(os.path.abspath(__file__))
+    verified_path = os.path.join(file_dir, "__pycache__", "shell2py-docs-verified.json")
+    if os.path.exists(verified_path):
+        os.remove(verified_path)
+
+    for filename in sorted(os.listdir(file_dir)):
+        (name, ext) = os.path.splitext(filename)
+        if ext == ".py":
+            module = importlib.import_module(name)
+
+            compile_argdoc = getattr(module, "compile_{}_argdoc".format(name), None)
+            if compile_argdoc:
+                compile_argdoc()  # exits nonzero when the Doc differs
+
+
 def _assert_eq_(want, got):
 
     assert want == got, (want, got)
@@ -104,168 +157,188 @@ def as_py_value(value):
     if '"' not in rep:
         rep = rep.replace("'", '"')
 
+    # Skip the slow check of a List of Str's, such as many TOP's of Ls
+    # (a Str holds no ' mark when its 'repr' holds no " mark, so the swap is safe)
+
+    if isinstance(value, list):
+        if all((type(_) is str) for _ in value):
+
+            return rep
+
     evalled = ast.literal_eval(rep)
     assert evalled == value, (evalled, value)
 
     return rep
 
 
-def py_pick_lines(py, module_py):
-    """Insert the next deeper layer of Def's mentioned by the Py"""
+def as_py_binary_regex(pyregex):
+    """Repr as rb"..." when easy, else fall back to Python Repr"""
 
-    # Keep the last Paragraph of Code
-    # (wrong when anchored by more, less, or different source lines)
+    rep = as_py_value(pyregex)
+    if b"\\" in pyregex:
+        if not pyregex.endswith(b"\\"):
+            if (b'"' not in pyregex) and pyregex.isascii():
+                chars = pyregex.decode()
+                rep = 'rb"{}"'.format(chars)
 
-    paras = split_paragraphs(py.splitlines())
-    core_py = "\n".join(paras[-1])
-
-    # Add Defs of each Name mentioned by Py
-    # (wrong for Mentions that don't mean Call Def:  Strings, Comments, etc)
-
-    names = sorted(set(re.findall(r"[A-Z_a-z][0-9A-Z_a-z]*", string=py)))
-    def_lines = _py_pick_def_lines(names, module_py=module_py)
-    defs_py = _py_pick_defs(def_lines, module_py=module_py)
+    return rep
 
-    got_py = defs_py + "\n\n\n" + core_py
 
-    return got_py
+def py_pick_closure(py, index, edit):
+    """Insert each Def called by the edited Py, and by the edited Def's, and so on"""
 
+    # Edit the Py, and each Def it calls, and each Def those call, etc
 
-def _py_pick_defs(def_lines, module_py):
-    """Pick out each Def Line and its Body, as ordered by Module Py"""
+    core_py = edit(py)
 
-    def_lines_set = set(def_lines)
-    inlines = module_py.splitlines()
+    def_py_by_name = dict()
+    names = list(py_mentions(core_py).names)
+    while names:
+        name = names.pop()
+        if (name in index.def_py_by_name) and (name not in def_py_by_name):
+            def_py = edit(index.def_py_by_name[name])
+            def_py_by_name[name] = def_py
 
-    outlines = list()
-    for (index, inline) in enumerate(inlines):
-        if inline in def_lines_set:
+            names.extend(py_mentions(def_py).names)
 
-            if True:  # TODO: more elegant tie to comments before 'def' func
-                if inline == "def stderr_print(*args, **kwargs):":
-                    outlines.append(
-                        "# deffed in many files  # missing from docs.python.org"
-                    )
+    # Emit the Def's in Module order, ahead of the Py
 
-            outlines.append(inline)
+    def_pys = list(
+        def_py_by_name[_] for _ in index.def_py_by_name if _ in def_py_by_name
+    )
+    defs_py = "\n\n\n".join(def_pys)
 
-            # Copy Lines of the Body till next Outdent
-            # ( wrong for Comments, Lines inside Multi-Line Strings, etc )
+    got_py = defs_py + "\n\n\n" + core_py
+    got_py = got_py.strip()  # such as empty 'defs_py'
 
-            for inline in inlines[(index + 1) :]:
-                if inline and not inline.startswith(" "):
+    return got_py
 
-                    break
 
-                outlines.append(inline)
+def py_add_imports(py, index):
+    """Pick Import Lines from the Module Index that match Mentions by Py"""
 
-                continue
+    names = sorted(py_mentions(py).dotted_names)
+    import_lines = list(
+        index.import_line_by_name[_] for _ in names if _ in index.import_line_by_name
+    )
+    import_py = "\n".join(import_lines)
 
-    chars = "\n".join(outlines).strip()
+    got_py = import_py + "\n\n\n" + py
+    got_py = got_py.strip()  # such as empty 'import_py'
 
-    return chars
+    return got_py
 
 
-def _py_pick_def_lines(names, module_py):
-    """Pick top-level Def Lines from Module-Py that match Mentions by Py"""
+def module_py__to_index_value(module_py):
+    """Parse the Module-Py, to find its top-level Def's and its Import's"""
 
-    # Pick out Top-Level Def Lines
-    # but go wrong over Comments, Multi-Line Strings, etc
+    lines = module_py.splitlines()
+    module = ast.parse(module_py)
 
-    def_line_by_name = dict()
-    for line in module_py.splitlines():
-        words = line.split()
-        if words and (words[0] == "def"):
-            deffed_name = words[1].split("(")[0]
+    # Find each top-level Def, with its Decorators, and the Comments just above it
 
-            assert deffed_name not in def_line_by_name, deffed_name
-            def_line_by_name[deffed_name] = line
+    starts = list()
+    for node in module.body:
+        decorator_list = getattr(node, "decorator_list", list())
+        start = min([node.lineno] + list(_.lineno for _ in decorator_list)) - 1
+        while start and lines[start - 1].startswith("#"):
+            start -= 1
 
-    # Pick out Top-Level Def Lines that got a Mention
+        starts.append(start)
 
-    picked_lines = list()
-    for name in names:
-        if name in def_line_by_name:
-            def_line = def_line_by_name[name]
+    def_pys = list()  # a List of Pairs, not a Dict, to keep Module order in Json
+    for (node, start, stop) in zip(module.body, starts, starts[1:] + [len(lines)]):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
 
-            picked_lines.append(def_line)
+            # End each Def before the Blank Lines and Comments ahead of the next Node
 
-    return picked_lines
+            def_lines = lines[start:stop]
+            while (not def_lines[-1]) or def_lines[-1].startswith("#"):
+                def_lines.pop()
 
+            assert node.name not in dict(def_pys), node.name
+            def_pys.append((node.name, "\n".join(def_lines)))
 
-def py_add_imports(py, module_py):
-    """Pick Import Lines from Module-Py that match Mentions by Py"""
+    # Find each Import, even when indented
 
-    namedots = sorted(set(re.findall(r"[A-Z_a-z][0-9A-Z_a-z]*[.]", string=py)))
-    # wrong when module mentioned outside of a "f{module}." context
+    import_line_by_name = dict()
+    for node in ast.walk(module):
+        if isinstance(node, ast.Import):
+            import_line = lines[node.lineno - 1].strip()
+            for alias in node.names:
+                imported_name = alias.asname
+                if not imported_name:  # such as 'import a.b' binding just 'a'
+                    imported_name = alias.name.partition(".")[0]
 
-    names = list(_[: -len(".")] for _ in namedots)
+                line = import_line_by_name.setdefault(imported_name, import_line)
+                assert line == import_line, (line, import_line)
 
-    import_lines = _py_pick_import_lines(names, module_py=module_py)
-    import_py = "\n".join(import_lines)
+    value = dict(def_pys=def_pys, import_line_by_name=import_line_by_name)
 
-    got_py = import_py + "\n\n\n" + py
-    got_py = got_py.strip()  # such as empty 'import_py'
+    return value
 
-    return got_py
 
+@functools.lru_cache(maxsize=None)
+def py_mentions(py):
+    """Collect the Names read by Py, apart from its Comments and Strings"""
 
-def _py_pick_import_lines(names, module_py):
-    """Pick 'import' lines from 'module_py' that define words of 'py'"""
+    # Parse the Py, else fall back to finding Names in Comments and Strings too
 
-    # Pick out defined Import Lines,
-    # but go wrong over From Imports, Conditional Imports, etc
+    try:
+        module = ast.parse(py.replace("$", "_"))  # '$TOPS' etc mark Values added last
+    except SyntaxError:
+        names = set(re.findall(r"[A-Z_a-z][0-9A-Z_a-z]*", string=py))
+        namedots = set(re.findall(r"[A-Z_a-z][0-9A-Z_a-z]*[.]", string=py))
+        dotted_names = set(_[: -len(".")] for _ in namedots)
 
-    import_line_by_name = dict()
+        return argparse.Namespace(names=names, dotted_names=dotted_names)
 
-    lines = module_py.splitlines()
-    lines = sorted(set(_.strip() for _ in lines if "import" in _))
+    # Collect each Name, and each Name found ahead of a "." Dot
 
-    for line in lines:
-        words = line.split()
-        if words and (words[0] == "import"):
-            imported_name = words[-1]
+    names = set()
+    dotted_names = set()
+    for node in ast.walk(module):
+        if isinstance(node, ast.Name):
+            names.add(node.id)
+        elif isinstance(node, ast.Attribute):
+            if isinstance(node.value, ast.Name):
+                dotted_names.add(node.value.id)
 
-            assert imported_name not in import_line_by_name, imported_name
-            import_line_by_name[imported_name] = line
+    return argparse.Namespace(names=names, dotted_names=dotted_names)
 
-    # Pick out Defined Import Lines that got a Mention
 
-    picked_lines = list()
-    for name in names:
-        if name in import_line_by_name:
-            import_line = import_line_by_name[name]
+def py_dedent_args(py, args, argnames, **truthy_by_name):
+    """Keep or drop Code guarded by these Args or Names, and drop all the Args"""
 
-            picked_lines.append(import_line)
+    # Keep or drop every guarded Block at once
 
-    return picked_lines
+    truthy_by_guard = dict()
+    for argname in argnames:
+        truthy_by_guard["args.{}".format(argname)] = bool(vars(args)[argname])
+    for (name, truthy) in truthy_by_name.items():
+        truthy_by_guard[name] = bool(truthy)
 
+    py1 = py_dedent_guards(py, truthy_by_guard=truthy_by_guard)
 
-def py_dedent_args(py, args, argnames):
-    """Keep or drop Code guarded by these Args, and drop all the Args"""
+    # Drop the falsey Args, then all the Args, then the falsey Names
 
-    py1 = py
     for argname in argnames:
-        truthy = bool(vars(args)[argname])
-        py1 = py_dedent_bool(py1, "args.{}".format(argname), truthy)
+        truthy = vars(args)[argname]
+        py1 = py_drop_falsey_arg(py1, name="args.{}".format(argname), truthy=truthy)
 
     py1 = py1.replace(", args)", ")")
     py1 = py1.replace("(args)", "()")
 
+    for (name, truthy) in truthy_by_name.items():
+        py1 = py_drop_falsey_arg(py1, name=name, truthy=truthy)
+
     return py1
 
 
-def py_dedent_bool(py, name, truthy):
-    """Keep or drop Code guarded by this Name, and drop the Name if falsey"""
+def py_drop_falsey_arg(py, name, truthy):
+    """Drop the Name from the end of Calls, if falsey"""
 
     py1 = py
-
-    if_yes_line = "if {}:".format(name)
-    py1 = py_dedent(py1, line=if_yes_line, truthy=truthy)
-
-    if_no_line = "if not {}:".format(name)
-    py1 = py_dedent(py1, line=if_no_line, truthy=(not truthy))
-
     if not truthy:
         py1 = py1.replace(", {name})".format(name=name), ")")
         py1 = py1.replace("({name})".format(name=name), "()")
@@ -273,70 +346,121 @@ def py_dedent_bool(py, name, truthy):
     return py1
 
 
-def py_dedent(py, line, truthy):  # noqa Flake8 C901 too complex (11)
-    """Keep or drop Code guarded by copies of this Guard Line, and drop the copies"""
+def py_dedent_guards(py, truthy_by_guard):
+    """Keep or drop Code guarded by 'if NAME:' or 'if not NAME:', in one pass"""
+
+    # List the Guard Lines, each with the truth of its Condition
+
+    truthy_by_line = dict()
+    for (name, truthy) in truthy_by_guard.items():
+        truthy_by_line["if {}:".format(name)] = truthy
+        truthy_by_line["if not {}:".format(name)] = not truthy
+
+    py1 = py_dedent_lines(py, truthy_by_line=truthy_by_line)
+
+    return py1
+
+
+def py_dedent_lines(py, truthy_by_line):  # noqa Flake8 C901 too complex (14)
+    """
+    Keep or drop Code guarded by these Lines, and drop the Lines, in one pass
+
+    Drop each Guard Line. Keep the Lines indented beneath a truthy Guard Line, but
+    shifted left by one Dent. Drop the Lines beneath a falsey Guard Line, with the
+    Blank Lines between them, and the Blank Lines just above, except those kept
+    above a truthy Guard Line dropped there that comes later in Truthy By Line
+
+    Quit with an AssertionError at a Multi-Line String beneath any Guard Line,
+    because shifting it left would change it, and its Dents don't close Guards
+    """
+
+    # Rank each Guard Line by its place in Truthy By Line
 
-    # Visit each Line of Py
+    rank_by_line = dict((line, rank) for (rank, line) in enumerate(truthy_by_line))
 
-    inlines = py.splitlines()
+    # Visit each Line of Py once
 
+    quoting = None  # the Triple Quote that opened a Multi-Line String, till closed
     outlines = list()
-    skip_index = 0
-    for (index, inline) in enumerate(inlines):
+    blanks = 0  # count Blank Lines not yet kept nor dropped
+    guards = list()  # stack the Dents of Guard Lines still open, with their truth
+    rank_by_index = dict()  # rank the truthy Guard Lines dropped from between Lines
+    for inline in py.splitlines():
 
-        # Don't revisit lines already found after finding the last Guard Line
+        # Keep each Line inside a Multi-Line String as is, when no Guard is open
 
-        if index < skip_index:
+        if quoting:
+            assert not guards, repr(inline)
+
+            outlines.extend(blanks * [""])
+            blanks = 0
+            outlines.append(inline)
+
+            if inline.count(quoting) % 2:
+                quoting = None
 
             continue
 
-        # Keep lines between Guard Line's
+        if not inline:
+            blanks += 1
 
-        if inline.strip() != line:
+            continue
 
-            outlines.append(inline)
+        for quote in ('"""', "'''"):
+            if inline.count(quote) % 2:
+                quoting = quote
 
-        else:
+        # Close the Guards outdented by this Line
+        # (wrong for outdented Comments, etc)
 
-            # Drop this Guard Line
+        (dent, _) = str_splitdent(inline)
+        while guards and (len(dent) <= len(guards[-1][0])):
+            guards.pop()
 
-            (top_dent, _) = str_splitdent(inline)
+        # Drop the Lines inside a falsey Guard, and the Blank Lines between them
 
-            skip_index = index
-            skip_index += 1
+        if any((not _[-1]) for _ in guards):
+            blanks = 0
 
-            # Loop till next Outdent
+            continue
 
-            for (sub_index, inline) in enumerate(inlines[(index + 1) :]):
+        # Drop each Guard Line, and drop the Blank Lines just above a falsey Guard
+        # Line, back to a truthy Guard Line that a later pass would have dropped
 
-                (dent, tail) = str_splitdent(inline)
-                # wrong inside Multi-Line Strings, wrong for indented Comments, etc
+        stripped = inline.strip()
+        if stripped in truthy_by_line.keys():
+            truthy = truthy_by_line[stripped]
+            rank = rank_by_line[stripped]
+            guards.append((dent, truthy))
 
-                if len(dent) <= len(top_dent):
-                    if inline:
+            if truthy:
+                outlines.extend(blanks * [""])
+                index = len(outlines)
+                rank_by_index[index] = max(rank, rank_by_index.get(index, rank))
+            else:
+                while outlines and not outlines[-1]:
+                    if rank_by_index.pop(len(outlines), rank) > rank:
 
                         break
 
-                # Shift left by one level of indentation
+                    outlines.pop()
 
-                outline = inline
-                if inline:
-                    assert inline.startswith(DENT + top_dent), repr(inline)
-                    outline = inline[len(DENT) :]
+            blanks = 0
 
-                # Keep the Lines after the Guard Line, if Guard truthy
-                # Drop only the non-blank Lines after the Guard Line, if Guard falsey
+            continue
 
-                if truthy or inline:
-                    skip_index = index + 1 + sub_index + 1
-                    if truthy:
-                        outlines.append(outline)
+        # Keep the Blank Lines above, and this Line, shifted left past truthy Guards
 
-            # Drop the trailing blank lines if Falsey Guard
+        outlines.extend(blanks * [""])
+        blanks = 0
 
-            if not truthy:
-                while outlines and not outlines[-1]:
-                    outlines = outlines[:-1]
+        outline = inline
+        if guards:
+            (top_dent, _) = guards[-1]
+            assert inline.startswith(DENT + top_dent), repr(inline)
+            outline = inline[(len(guards) * len(DENT)) :]
+
+        outlines.append(outline)
 
     # Return chars, not lines
 
@@ -355,11 +479,115 @@ def module_name__main(name, argv__to_py, argv=sys.argv):
 
     py = module_name__to_main_py(name, argv__to_py=argv__to_py, argv=argv)
 
+    # Pass some Values outside of the Python, when the Verb knows how
+
+    module = sys.modules[name]
+    verb = module_name__verb(name)
+    argv_py__to_exec = getattr(module, "argv_py__to_{}_exec".format(verb), None)
+
+    exec_py = py
     globals_ = dict()
-    exec(py, globals_)
+    if argv_py__to_exec:
+        (exec_py, globals_) = argv_py__to_exec(argv, py=py)
+
+    # Run the Python
+
+    code = py_to_code(exec_py)
+    exec(code, globals_)
     globals().update(globals_)
 
 
+def py_to_code(py):
+    """Compile the Python, else load its Code compiled before, as keyed by its Hash"""
+
+    # Look for a '.pyc' File of this Python from this Python Version
+
+    py_bytes = py.encode()
+    sha256 = hashlib.sha256(py_bytes).digest()
+
+    flags = (0b11).to_bytes(4, "little")  # hash-based and checked, per PEP 552
+    head = importlib.util.MAGIC_NUMBER + flags + importlib.util.source_hash(py_bytes)
+
+    pyc_name = sha256.hex() + ".pyc"
+    pyc_path = os.path.join(cache_dir_path(), "shell2py-pyc", pyc_name)
+
+    data = read_bytes_else_none(pyc_path)
+    if data and data.startswith(head):
+        try:
+            code = marshal.loads(data[len(head) :])
+
+            return code
+
+        except (EOFError, TypeError, ValueError):
+            pass  # such as a torn File
+
+    # Else compile the Python, and keep the Code on disk
+
+    code = compile(py, "<string>", "exec")  # '<string>' as when 'exec(py)'
+    write_bytes_if_able(pyc_path, data=(head + marshal.dumps(code)))
+    prune_cache_dir(os.path.dirname(pyc_path))
+
+    return code
+
+
+@functools.lru_cache(maxsize=None)
+def module_name__index(name):
+    """Index the Source of the Module once per process, and keep the Index on disk"""
+
+    module = sys.modules[name]
+    module_py = module_name__readlines(name)
+
+    # Load the Index built before, for this same Source
+
+    key_value = dict(
+        name=name,
+        module_py_sha256=hashlib.sha256(module_py.encode()).hexdigest(),
+        scraps_sha256=file_sha256(__file__),
+    )
+
+    key_json = json.dumps(key_value, sort_keys=True)
+    key = hashlib.sha256(key_json.encode()).hexdigest()
+
+    index_path = os.path.join(cache_dir_path(), "shell2py-index", key + ".json")
+    value = read_json_else_none(index_path)
+
+    # Else build the Index, with the Rewrites of the Module if any, and keep it
+
+    if value is None:
+        value = module_py__to_index_value(module_py)
+
+        verb = module_name__verb(name)
+        module_py__to_rewrites = getattr(
+            module, "module_py__to_{}_rewrites".format(verb), None
+        )
+        rewrites = list()
+        if module_py__to_rewrites:
+            rewrites = module_py__to_rewrites(module_py)
+
+        value["rewrites"] = rewrites
+
+        write_json_if_able(index_path, value=value)
+
+    index = argparse.Namespace(
+        py=module_py,
+        def_py_by_name=dict(value["def_pys"]),
+        import_line_by_name=value["import_line_by_name"],
+        rewrites=list(tuple(_) for _ in value["rewrites"]),
+    )
+
+    return index
+
+
+def module_name__verb(name):
+    """Name the Verb of the Module, even when run as '__main__'"""
+
+    module = sys.modules[name]
+    verb = os.path.splitext(os.path.basename(module.__file__))[0]
+
+    return verb
+
+
+@functools.lru_cache(maxsize=None)
 def module_name__readlines(name):
     """Copy-edit the source lines of the module, but drop its meta-comment's"""
 
@@ -384,6 +612,19 @@ def module_name__to_main_py(name, argv__to_py, argv):
     file = os.path.basename(module.__file__)  # such as 'ls.py'
     doc = module.__doc__
 
+    # Reuse the Python written before, for the same Verb, ArgV, Facts, and Source
+
+    py_cache_path = module_name__py_cache_path(name, argv=argv, func=argv__to_py)
+
+    data = read_bytes_else_none(py_cache_path)
+    count_py_cache(hit=(data is not None))
+    if data is not None:
+        py = data.decode()
+
+        return py
+
+    # Else write the Python
+
     func = argv__to_py
     py = func(argv)
 
@@ -398,9 +639,42 @@ def module_name__to_main_py(name, argv__to_py, argv):
 
     assert py, (func, argv)
 
+    write_bytes_if_able(py_cache_path, data=py.encode())
+    prune_cache_dir(os.path.dirname(py_cache_path))
+
     return py
 
 
+def module_name__py_cache_path(name, argv, func):
+    """Name the Python File to write for the Verb, ArgV, Facts, Func, and Source"""
+
+    module = sys.modules[name]
+
+    # Fetch the Facts of the Filesystem that choose which Python to write, if any
+
+    verb = module_name__verb(name)
+    argv__to_facts = getattr(module, "argv__to_{}_facts".format(verb), None)
+    facts = argv__to_facts(argv) if argv__to_facts else None
+
+    # Hash the Verb, the ArgV, the Facts, the Func, and the Source that writes the Py
+
+    key_value = dict(
+        name=name,
+        args=argv[1:],  # not 'argv[0]', such as 'ls' vs 'ls.py' vs 'bin/ls.py'
+        facts=facts,
+        func=func.__name__,  # such as 'argv__to_ls_py' vs 'argv__to_ls_fast_py'
+        module_sha256=file_sha256(module.__file__),
+        scraps_sha256=file_sha256(__file__),
+    )
+
+    key_json = json.dumps(key_value, sort_keys=True)
+    key = hashlib.sha256(key_json.encode()).hexdigest()
+
+    py_cache_path = os.path.join(cache_dir_path(), "shell2py-py", key + ".py")
+
+    return py_cache_path
+
+
 def argv__to_shline_py(argv):
     """Write Python to trace and call this Main ArgV, else print some Help and quit"""
 
@@ -433,6 +707,129 @@ def argv__to_shline_py(argv):
     return py
 
 
+#
+# Keep some results on disk, to skip work on later runs
+#
+
+
+def cache_dir_path():
+    """Name the Dir of results kept on disk, and make it if missing and able"""
+
+    file_dir = os.path.dirname(os.path.abspath(__file__))
+    cache_dir = os.path.join(file_dir, "__pycache__")
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        pass  # such as a read-only install
+
+    return cache_dir
+
+
+PY_CACHE_COUNTS = dict(hits=0, misses=0)  # counts for this process, not kept on disk
+
+CACHE_DIR_MAX_FILES = 1024  # prune a Dir of results kept on disk, past this many
+
+
+def count_py_cache(hit):
+    """Count one more Hit or Miss, in this process"""
+
+    key = "hits" if hit else "misses"
+    PY_CACHE_COUNTS[key] += 1
+
+
+def prune_cache_dir(path, max_files=CACHE_DIR_MAX_FILES):
+    """Remove the Files least recently written, when a Dir holds too many"""
+
+    try:
+        with os.scandir(path) as entries:
+            names = list(_.name for _ in entries)
+    except OSError:
+        return  # such as a Dir never made
+
+    if len(names) <= max_files:
+        return
+
+    # Keep the newer half, so as to prune again only after many more writes
+
+    mtime_names = list()
+    for name in names:
+        try:
+            mtime = os.stat(os.path.join(path, name)).st_mtime
+        except OSError:
+            continue  # such as a File pruned by a parallel run
+        mtime_names.append((mtime, name))
+
+    mtime_names.sort()
+    for (_, name) in mtime_names[: -(max_files // 2)]:
+        try:
+            os.remove(os.path.join(path, name))
+        except OSError:
+            pass  # such as a File pruned by a parallel run
+
+
+@functools.lru_cache(maxsize=None)
+def file_sha256(path):
+    """Hash the Bytes of a File, once per process"""
+
+    with open(path, "rb") as reading:
+        data = reading.read()
+
+    hexdigest = hashlib.sha256(data).hexdigest()
+
+    return hexdigest
+
+
+def read_bytes_else_none(path):
+    """Read the Bytes of a File, else return None if missing"""
+
+    try:
+        with open(path, "rb") as reading:
+            data = reading.read()
+    except OSError:
+        return None
+
+    return data
+
+
+def read_json_else_none(path):
+    """Read a Json Dict from a File, else return None if missing or torn or such"""
+
+    data = read_bytes_else_none(path)
+    if data is None:
+        return None
+
+    try:
+        value = json.loads(data)
+    except ValueError:
+        return None
+
+    if not isinstance(value, dict):
+        return None
+
+    return value
+
+
+def write_bytes_if_able(path, data):
+    """Replace a File all at once, else leave it be"""
+
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "wb") as writing:
+            writing.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # such as a read-only install
+
+
+def write_json_if_able(path, value):
+    """Replace a Json File all at once, else leave it be"""
+
+    chars = json.dumps(value, indent=2, sort_keys=True) + "\n"
+    write_bytes_if_able(path, data=chars.encode())
+
+
 #
 # Run with a layer of general-purpose Python idioms
 #
@@ -598,20 +995,48 @@ def exit_unless_doc_eq(parser):
     module_doc = module.__doc__
     module_file = f.f_back.f_code.co_filename  # more available than 'module.__file__'
 
-    # Fetch the two docs
+    # Skip the check, if this same Doc and Help passed it before
+
+    want_doc = parser_format_help_89(parser)
+
+    key = os.path.split(module_file)[-1]
+    digest = docs_sha256(got_doc=module_doc, want_doc=want_doc)
+
+    verified_path = os.path.join(cache_dir_path(), "shell2py-docs-verified.json")
+    verified = read_json_else_none(verified_path) or dict()
+    if verified.get(key) == digest:
+
+        return
+
+    # Else check now, and remember the check passed
+
+    _exit_unless_doc_eq(module_doc, want_doc=want_doc, module_file=module_file)
+
+    verified[key] = digest
+    write_json_if_able(verified_path, value=verified)
 
-    got_doc = module_doc.strip()
+
+def parser_format_help_89(parser):
+    """Say what the Parser says in its Help, when given 89 Columns"""
 
     with_columns = os.getenv("COLUMNS")
     os.environ["COLUMNS"] = str(89)  # Black promotes 89 columns per line
     try:
-        want_doc = parser.format_help()
+        help_doc = parser.format_help()
     finally:
         if with_columns is None:
             os.environ.pop("COLUMNS")
         else:
             os.environ["COLUMNS"] = with_columns
 
+    return help_doc
+
+
+def _exit_unless_doc_eq(module_doc, want_doc, module_file):
+    """Exit nonzero, unless the Module Doc equals "parser.format_help()" """
+
+    got_doc = module_doc.strip()
+
     # Ignore Line-Break's jittering across Python Versions
 
     (alt_got, alt_want) = (got_doc, want_doc)
@@ -649,6 +1074,22 @@ def exit_unless_doc_eq(parser):
         sys.exit(1)  # trust caller to log SystemExit exceptions well
 
 
+def docs_sha256(got_doc, want_doc):
+    """Hash the Module Doc, and what the Parser says in its Help, and what says it"""
+
+    key_value = dict(
+        got_doc=got_doc,
+        want_doc=want_doc,
+        version=list(sys.version_info[:3]),  # because Help jitters across Versions
+        scraps_sha256=file_sha256(__file__),
+    )
+
+    key_json = json.dumps(key_value, sort_keys=True)
+    sha256 = hashlib.sha256(key_json.encode()).hexdigest()
+
+    return sha256
+
+
 # deffed in many files  # missing from docs.python.org till Oct/2019 Python 3.8
 def join_first_paragraph(doc):
     """Join by single spaces all the leading lines up to the first empty line"""
@@ -23,6 +23,7 @@ examples:
   echo.py --v 'Hello,' 'Echo World!'
 """
 
+import functools
 import textwrap
 
 import _scraps_
@@ -33,6 +34,7 @@ def main():
     _scraps_.module_name__main(__name__, argv__to_py=argv__to_echo_py)
 
 
+@functools.lru_cache(maxsize=None)
 def compile_echo_argdoc():
     """Convert the Echo Main Doc to an ArgParse Parser"""
 
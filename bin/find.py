@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
 """
-usage: find.py [-h] [--maxdepth MAXDEPTH] [--name NAME] [--not] [--prune] [--o]
-               [--type D] [--print]
+usage: find.py [-h] [--maxdepth MAXDEPTH] [--name NAME] [--iname NAME] [--path PATH]
+               [--type C] [--newer FILE] [--size N] [--mtime N] [--mmin N] [--empty]
+               [--not] [--a] [--o] [--prune] [--print] [--jobs N]
                [TOP]
 
 show a top dir of dirs, and the files and dirs it contains
@@ -14,34 +15,69 @@ optional arguments:
   -h, --help           show this help message and exit
   --maxdepth MAXDEPTH  look just here at depth 1, or also children at depth 2, etc
   --name NAME          find only names matching the glob pattern, such as '.?*'
+  --iname NAME         find only names matching the glob pattern, in upper or lower case
+  --path PATH          find only paths matching the glob pattern, such as './bin/*'
+  --type C             find only dirs 'd', or only files 'f', or only symlinks 'l'
+  --newer FILE         find only names changed more recently than this file
+  --size N             find only sizes of N blocks, '-N' fewer, or '+N' more, like '-4k'
+  --mtime N            find only names changed N days ago, '-N' fewer, or '+N' more
+  --mmin N             find only names changed N minutes ago, '-N' fewer, or '+N' more
+  --empty              find only empty dirs, and empty files
   --not                reverse what follows, like '-not type d' to find files not dirs
-  --prune              don't show these names, maybe show some others
+  --a                  require this and what follows, as when '-a' left out
   --o                  introduce an alt choice, such as to '-o -print'
-  --type D             find only dirs of dirs, not also files
+  --prune              don't walk into these dirs, maybe show some others
   --print              show names not pruned, when asked to '-prune -o -print'
+  --jobs N             list as many as N dirs at a time (default: 1)
 
 quirks:
-  gets many combinations wrong, such as:  find . -type d -name '.?*' -prune -o -print
+  takes '!' as '-not', and '(' ')' to group, such as:  '(' -name a -o -name b ')'
+  tests names and paths, then types, then stats, but keeps '-print' & '-prune' in place
+  stats each name at most once, and looks up each '-newer' file and the time only once
+  shows the dirs inside each dir first, then its files, sorted, unlike Linux & Mac
   Linux & Mac make you to type '-' in place of '--' for 'find' options
   Linux * Mac make you type the TOP only before the '-' or '--' options, never after
   Mac makes you spell out 'find .', in place of 'find', to search the Current Dir
+  defines '--jobs', and still shows names in order, while listing up to 4N dirs ahead
 
 examples:
   find . -maxdepth 1 -type d  # dirs inside this dir, but not their children
   find . -name '.?*'  # dirs and files inside, but only hidden ones
   find . -name '.?*' -prune -o -print  # dirs and files inside, but not hidden ones
   find . -type d  # all the dirs of dirs here
+  find . --jobs 8  # all the dirs and files here, listing 8 dirs at a time
   find . -not -type d  # all the files, none of the dirs
-  find . -type d -name '.?*' -prune -o -print  # like 'find -type d' but no hidden ones
+  find . -type d -name '.?*' -prune -o -print  # all, but not inside hidden dirs
+  find . -iname '*.md' -o -path './bin/*.py'  # some files by name, some by path
+  find . -type f -mtime -1  # the files changed in the last 24 hours
+  find . -newer Makefile -size +4k  # the bigger names changed since the Makefile
 """
 
-# TODO: -newer, -size
-
+import fnmatch
+import functools
+import os
+import re
 import sys
 
 import _scraps_
 
 
+FIND_TESTS = "-name -iname -path -type -newer -size -mtime -mmin".split()  # 1 Arg each
+FIND_OPERATORS = "-not ! -a -o ( ) -prune -print -empty".split()  # each takes no Args
+
+FIND_COSTS = dict(name=1, iname=1, path=1, type=2)  # relative costs of each Test
+FIND_COSTS.update(newer=3, size=3, mtime=3, mmin=3, empty=4)  # stat, or list the Dir
+
+FIND_ARG_REGEXES = dict(size=r"[-+]?[0-9]+[cwbkMG]?", mtime=r"[-+]?[0-9]+")
+FIND_ARG_REGEXES.update(mmin=FIND_ARG_REGEXES["mtime"], type=r"[dfl]")
+
+FIND_ARG_HINTS = dict(size="like -1k, +2M, or 3G", type="d, f, or l")
+FIND_ARG_HINTS.update(mtime="like -1, +2, or 3", mmin="like -1, +2, or 3")
+
+FIND_SIZE_UNITS = dict(c=1, w=2, b=512, k=1024, M=1024**2, G=1024**3)
+FIND_AGE_UNITS = dict(mtime=24 * 60 * 60, mmin=60)  # Seconds per Day, per Minute
+
+
 def main():
 
     _scraps_.module_name__main(__name__, argv__to_py=argv__to_find_py)
@@ -54,30 +90,101 @@ def parse_find_args(argv):
 
     parser = compile_find_argdoc()
 
-    altv = list(argv)
-    for (index, arg) in enumerate(altv):
-        if arg.startswith("-") and not arg.startswith("--"):
-            altv[index] = "-" + arg  # change to "--" from "-"
+    (altv, words) = split_find_argv(argv)
 
     # Parse args
 
     args = parser.parse_args(altv[1:])
-    _scraps_.args_cancel_pairs(args, exclusions="maxdepth".split())
+    _scraps_.args_cancel_pairs(args, exclusions="maxdepth jobs".split())
+
+    args.words = words
 
     # Close out
 
     if args.maxdepth is not None:
 
         try:
-            _ = int(args.maxdepth)
+            maxdepth = int(args.maxdepth)
+            if maxdepth < 0:
+                raise ValueError("{} is less than 0".format(maxdepth))
         except ValueError as exc:
             sys.stderr.write("find.py: error: argument -maxdepth: {}\n".format(exc))
 
             sys.exit(2)
 
+    if args.jobs is not None:
+
+        try:
+            args.jobs = int(args.jobs)
+            if args.jobs < 1:
+                raise ValueError("{} is less than 1".format(args.jobs))
+        except ValueError as exc:
+            sys.stderr.write("find.py: error: argument --jobs: {}\n".format(exc))
+
+            sys.exit(2)
+
     return args
 
 
+def argv__to_find_facts(argv):
+    """Pick out the Facts of the Filesystem that choose which Find Python to write"""
+
+    (_, words) = split_find_argv(argv)
+
+    # Say if each '-newer' File exists, so as to reject it again when gone
+
+    newer_lexists = list()
+    index = 0
+    while index < len(words):
+        word = words[index]
+        index += 1
+        if word in FIND_TESTS:
+            args = words[index:][:1]
+            index += 1
+            if word == "-newer":
+                newer_lexists.extend(os.path.lexists(_) for _ in args)
+
+    facts = dict(newer_lexists=newer_lexists)
+
+    return facts
+
+
+def split_find_argv(argv):
+    """Split the Words of the Find Expression away from the Args of ArgParse"""
+
+    altv = argv[:1]
+    words = list()
+
+    index = 1
+    while index < len(argv):
+        arg = argv[index]
+        index += 1
+
+        word = arg
+        if arg.startswith("--"):
+            word = arg[len("-") :]  # change to "-" from "--"
+
+        # Take the Words of the Expression in order, with their Args
+
+        if word in FIND_OPERATORS:
+            words.append(word)
+        elif word in FIND_TESTS:
+            words.append(word)
+            words.extend(argv[index:][:1])
+            index += 1
+
+        # Leave the rest to ArgParse, such as TOP, or '-maxdepth', or '-h'
+
+        else:
+            altv.append(("-" + word) if word.startswith("-") else word)
+            if word in ("-maxdepth", "-jobs"):
+                altv.extend(argv[index:][:1])
+                index += 1
+
+    return (altv, words)
+
+
+@functools.lru_cache(maxsize=None)
 def compile_find_argdoc():
     """Convert the Find Main Doc to an ArgParse Parser"""
 
@@ -94,6 +201,8 @@ def compile_find_argdoc():
         help="look just here at depth 1, or also children at depth 2, etc",
     )
 
+    # Show the Words of the Expression as Options, but parse them apart
+
     parser.add_argument(
         "--name",
         metavar="NAME",
@@ -101,6 +210,56 @@ def compile_find_argdoc():
         help="find only names matching the glob pattern, such as '.?*'",
     )
 
+    parser.add_argument(
+        "--iname",
+        metavar="NAME",
+        help="find only names matching the glob pattern, in upper or lower case",
+    )
+
+    parser.add_argument(
+        "--path",
+        metavar="PATH",
+        help="find only paths matching the glob pattern, such as './bin/*'",
+    )
+
+    parser.add_argument(
+        "--type",
+        metavar="C",
+        dest="type",
+        help="find only dirs 'd', or only files 'f', or only symlinks 'l'",
+    )
+
+    parser.add_argument(
+        "--newer",
+        metavar="FILE",
+        help="find only names changed more recently than this file",
+    )
+
+    parser.add_argument(
+        "--size",
+        metavar="N",
+        help="find only sizes of N blocks, '-N' fewer, or '+N' more, like '-4k'",
+    )
+
+    parser.add_argument(
+        "--mtime",
+        metavar="N",
+        help="find only names changed N days ago, '-N' fewer, or '+N' more",
+    )
+
+    parser.add_argument(
+        "--mmin",
+        metavar="N",
+        help="find only names changed N minutes ago, '-N' fewer, or '+N' more",
+    )
+
+    parser.add_argument(
+        "--empty",
+        action="count",
+        default=0,
+        help="find only empty dirs, and empty files",
+    )
+
     parser.add_argument(
         "--not",
         dest="not_",
@@ -109,10 +268,10 @@ def compile_find_argdoc():
     )
 
     parser.add_argument(
-        "--prune",
+        "--a",
         action="count",
         default=0,
-        help="don't show these names, maybe show some others",
+        help="require this and what follows, as when '-a' left out",
     )
 
     parser.add_argument(
@@ -123,10 +282,10 @@ def compile_find_argdoc():
     )
 
     parser.add_argument(
-        "--type",
-        metavar="D",
-        dest="type",
-        help="find only dirs of dirs, not also files",
+        "--prune",
+        action="count",
+        default=0,
+        help="don't walk into these dirs, maybe show some others",
     )
 
     parser.add_argument(
@@ -136,11 +295,334 @@ def compile_find_argdoc():
         help="show names not pruned, when asked to '-prune -o -print'",
     )
 
+    parser.add_argument(
+        "--jobs",
+        metavar="N",
+        help="list as many as N dirs at a time (default: 1)",
+    )
+
     _scraps_.exit_unless_doc_eq(parser)
 
     return parser
 
 
+#
+# Compile the Find Expression into one Python Expression
+#
+
+
+def find_words_to_tree(words):
+    """Parse the Words of the Expression into a Tree, else print some Help and quit"""
+
+    pending = list(reversed(words))  # the next Word last
+
+    tree = ("print",)
+    if pending:
+        tree = find_pending_or(pending)
+        if pending:
+            exit_find_expression("unexpected {}".format(pending[-1]))
+
+    # Print each Path found, when no Action says otherwise
+
+    if not find_tree_has_op(tree, op="print"):
+        tree = ("and", [tree, ("print",)])
+
+    return tree
+
+
+def find_tree_has_op(tree, op):
+    """Say if any Node of the Tree is this Test or Action or Operator"""
+
+    if tree[0] == op:
+        return True
+
+    if tree[0] == "not":
+        return find_tree_has_op(tree[1], op=op)
+
+    if tree[0] in ("and", "or"):
+        return any(find_tree_has_op(_, op=op) for _ in tree[1])
+
+    return False
+
+
+def find_pending_or(pending):
+    """Parse one or more '-a' Expressions, separated by '-o'"""
+
+    kids = [find_pending_and(pending)]
+    while pending and (pending[-1] == "-o"):
+        pending.pop()
+        kids.append(find_pending_and(pending))
+
+    tree = kids[0] if (len(kids) == 1) else ("or", kids)
+
+    return tree
+
+
+def find_pending_and(pending):
+    """Parse one or more '-not' Expressions, separated by '-a' or by nothing"""
+
+    kids = [find_pending_not(pending)]
+    while pending and (pending[-1] not in ("-o", ")")):
+        if pending[-1] == "-a":
+            pending.pop()
+        kids.append(find_pending_not(pending))
+
+    tree = kids[0] if (len(kids) == 1) else ("and", kids)
+
+    return tree
+
+
+def find_pending_not(pending):
+    """Parse one Test or Action or '(' Group, after any count of '-not' or '!'"""
+
+    if pending and (pending[-1] in ("-not", "!")):
+        pending.pop()
+        tree = ("not", find_pending_not(pending))
+
+        return tree
+
+    if not pending:
+        exit_find_expression("expected an expression at end of line")
+
+    word = pending.pop()
+
+    if word == "(":
+        tree = find_pending_or(pending)
+        if not (pending and (pending.pop() == ")")):
+            exit_find_expression("expected a ')' after the '('")
+
+        return tree
+
+    if word in FIND_TESTS:
+        if not pending:
+            exit_find_expression("argument {}: expected one argument".format(word))
+
+        arg = pending.pop()
+        exit_unless_find_arg(word, arg=arg)
+
+        tree = (word[len("-") :], arg)
+
+        return tree
+
+    if word in ("-print", "-prune", "-empty"):
+        tree = (word[len("-") :],)
+
+        return tree
+
+    exit_find_expression("unexpected {}".format(word))
+
+
+def exit_unless_find_arg(word, arg):
+    """Reject a Find Test Arg we can't test, and explain why"""
+
+    op = word[len("-") :]
+    regex = FIND_ARG_REGEXES.get(op)
+    if regex and not re.fullmatch(regex, string=arg):
+        quoted = _scraps_.shlex_quote(arg)
+        hint = FIND_ARG_HINTS[op]
+        exit_find_expression("argument {} {}: choose {}".format(word, quoted, hint))
+
+    if word == "-newer":
+        try:
+            os.lstat(arg)
+        except OSError as exc:
+            quoted = _scraps_.shlex_quote(arg)
+            exit_find_expression("argument -newer {}: {}".format(quoted, exc.strerror))
+
+
+def exit_find_expression(chars):
+    """Reject a Find Expression we can't parse, and explain why"""
+
+    sys.stderr.write("find.py: error: {}\n".format(chars))
+
+    sys.exit(2)
+
+
+def find_tree_cost(tree):
+    """Count how costly a Tree is to test, else None if it Prints or Prunes"""
+
+    op = tree[0]
+    if op in ("print", "prune"):
+        return None
+
+    if op in FIND_COSTS.keys():
+        return FIND_COSTS[op]
+
+    if op == "not":
+        return find_tree_cost(tree[1])
+
+    costs = list(find_tree_cost(_) for _ in tree[1])
+    if None in costs:
+        return None
+
+    return sum(costs)
+
+
+def find_tree_reorder(tree):
+    """Test the cheaper Tests first, but keep each '-print' and '-prune' in place"""
+
+    op = tree[0]
+    if op == "not":
+        return ("not", find_tree_reorder(tree[1]))
+
+    if op not in ("and", "or"):
+        return tree
+
+    # Flatten '-a' inside of '-a', and '-o' inside of '-o'
+
+    kids = list()
+    for kid in tree[1]:
+        kid = find_tree_reorder(kid)
+        if kid[0] == op:
+            kids.extend(kid[1])
+        else:
+            kids.append(kid)
+
+    # Sort each run of Tests by cost, but keep the Actions between them in place
+
+    sorted_kids = list()
+    tests = list()
+    for kid in kids + [None]:
+        if (kid is not None) and (find_tree_cost(kid) is not None):
+            tests.append(kid)
+        else:
+            sorted_kids.extend(sorted(tests, key=find_tree_cost))
+            tests = list()
+            if kid is not None:
+                sorted_kids.append(kid)
+
+    return (op, sorted_kids)
+
+
+def find_tree_to_py(tree, refs):
+    """Write a Tree as one Python Expression, and list the References it needs"""
+
+    op = tree[0]
+
+    if op in ("and", "or"):
+        pys = list()
+        for kid in tree[1]:
+            kid_py = find_tree_to_py(kid, refs=refs)
+            if (op == "and") and (kid[0] == "or"):
+                kid_py = "(" + kid_py + ")"
+            pys.append(kid_py)
+
+        return " {} ".format(op).join(pys)
+
+    if op == "not":
+        kid_py = find_tree_to_py(tree[1], refs=refs)
+        if tree[1][0] in ("and", "or"):
+            kid_py = "(" + kid_py + ")"
+
+        return "not " + kid_py
+
+    if op in ("print", "prune"):
+        return "find_{}(path)".format(op)
+
+    return find_test_to_py(tree, refs=refs)
+
+
+def find_test_to_py(tree, refs):
+    """Write one Test as a Python Expression, and list the References it needs"""
+
+    (op, arg) = (tree + (None,))[:2]
+
+    if op == "type":
+        py_by_type = dict(
+            d="entry.is_dir(follow_symlinks=False)",
+            f="entry.is_file(follow_symlinks=False)",
+            l="entry.is_symlink()",
+        )
+
+        return py_by_type[arg]
+
+    if op == "empty":
+        return "find_empty(entry)"
+
+    if op == "size":
+        return find_size_to_py(arg)
+
+    # Resolve each Glob Pattern, Reference File, and Reference Time, once per run
+
+    ref = "{}_{}".format(op, len(refs) + 1)  # such as 'name_1'
+    refs.append((ref, op, arg))
+
+    if op in ("name", "iname"):
+        return "{}(name)".format(ref)
+
+    if op == "path":
+        return "{}(path)".format(ref)
+
+    st_mtime = "entry.stat(follow_symlinks=False).st_mtime"
+    if op == "newer":
+        return "{}_ns > {}".format(st_mtime, ref)
+
+    # Compare an Age, such as '-mtime -1' for less than 1 Day old
+
+    if arg.startswith("+"):
+        return "{} <= {}".format(st_mtime, ref)
+    elif arg.startswith("-"):
+        return "{} > {}".format(st_mtime, ref)
+
+    return "{} < {} <= {} + {}".format(ref, st_mtime, ref, FIND_AGE_UNITS[op])
+
+
+def find_size_to_py(arg):
+    """Compare a Size, rounded up to a Unit, by comparing Bytes"""
+
+    st_size = "entry.stat(follow_symlinks=False).st_size"
+
+    unit = FIND_SIZE_UNITS["b"]  # 512 Byte Blocks by default
+    digits = arg.lstrip("+-")
+    if digits[-1:] in FIND_SIZE_UNITS.keys():
+        unit = FIND_SIZE_UNITS[digits[-1]]
+        digits = digits[:-1]
+
+    count = int(digits)
+    if arg.startswith("+"):
+        return "{} > {}".format(st_size, count * unit)
+    elif arg.startswith("-"):
+        return "{} <= {}".format(st_size, (count - 1) * unit)
+
+    return "{} < {} <= {}".format((count - 1) * unit, st_size, count * unit)
+
+
+def find_refs_to_py(refs):
+    """Compile each Glob Pattern once, and look up each Reference once"""
+
+    lines = list()
+    if any((op in FIND_AGE_UNITS.keys()) for (_, op, _) in refs):
+        lines.append("now = time.time()")
+
+    for (ref, op, arg) in refs:
+        quoted = _scraps_.shlex_quote(arg)
+
+        if op == "newer":
+            py = "os.lstat({}).st_mtime_ns".format(_scraps_.as_py_value(arg))
+        elif op in FIND_AGE_UNITS.keys():
+            count = int(arg.lstrip("+-"))
+            if (op == "mtime") and not arg.startswith("-"):
+                count += 1  # drop the fraction of a Day, but not of a Minute
+            py = "now - {}".format(count * FIND_AGE_UNITS[op])
+        else:
+            regex = os.fsencode(fnmatch.translate(arg))
+            rep = _scraps_.as_py_binary_regex(regex)
+            flags = ", re.IGNORECASE" if (op == "iname") else ""
+            py = "re.compile({}{}).match".format(rep, flags)
+
+        line = "{} = {}  # -{} {}".format(ref, py, op, quoted)
+        lines.append(line)
+
+    py = "\n".join(lines)
+
+    return py
+
+
+#
+# Form the Python of Find
+#
+
+
 def argv__to_find_py(argv):
     """Write the Python for a Find ArgV, else print some Help and quit"""
 
@@ -148,22 +630,14 @@ def argv__to_find_py(argv):
 
     top = args.top if args.top else "."
 
-    # Reject obvious contradictions
-
-    drop_deeper = args.maxdepth
-    drop_dirs = args.type and args.not_
-    drop_files = args.type and not args.not_
-    drop_hidden = args.name and args.prune and args.o and args.print
-    take_hidden = args.name and not drop_hidden
-
-    exit_unless_simple_find(
-        args,
-        drop_deeper=drop_deeper,
-        drop_dirs=drop_dirs,
-        drop_files=drop_files,
-        drop_hidden=drop_hidden,
-        take_hidden=take_hidden,
-    )
+    # Compile the Expression
+
+    tree = find_words_to_tree(args.words)
+    tree = find_tree_reorder(tree)
+
+    refs = list()
+    test_py = find_tree_to_py(tree, refs=refs)
+    refs_py = find_refs_to_py(refs)
 
     # Form a stylish copy of the Shell Find Command Line
 
@@ -173,46 +647,209 @@ def argv__to_find_py(argv):
 
     py = '''
 
+#if JOBS
+        import concurrent.futures
+#endif
         import os
+#if REGEXES
+        import re
+#endif
+#if TOP_ENTRY
+        import stat
+#endif
+        import sys
+#if CLOCK
+        import time
+#endif
 
         def find(top):
             """$SHLINE"""
 
-            print(top)
-            for (dirpath, dirnames, filenames) in os.walk(top):
+#if REFS
+            $REFS
 
-#if DROP_DEEPER
-                depth = 1 + dirpath.count(os.sep)
-                if depth > $MAXDEPTH:
-                    continue
+#endif
+            fd = sys.stdout.fileno()
+            with open(fd, "wb", buffering=0x100000, closefd=False) as writing:  # 1 MiB
 
+                found = list()  # the Paths found, but not yet written
+#if PRUNES
+                prunes = set()  # the Dirs found, but not to walk into
 #endif
-#if DROP_DIRS
+
+                def find_print(path):
+                    found.append(path + b"\\n")
+                    return True
+
+#if PRUNES
+                def find_prune(path):
+                    prunes.add(path)
+                    return True
+
+#endif
+#if STATS
+                def find_test(path, name, entry):
+                    try:
+                        return $TEST
+                    except OSError:
+                        return False  # such as a File deleted since listed
 #else
-  #if DROP_HIDDEN
-                dirnames[:] = list(_ for _ in dirnames if not _.startswith("."))
+                def find_test(path, name, entry):
+                    return $TEST
+#endif
+
+                # Test the Top
+
+                top_bytes = os.fsencode(top)
+                top_name = os.path.basename(top_bytes.rstrip(b"/")) or top_bytes
+#if TOP_ENTRY
+                find_test(top_bytes, top_name, FindTopEntry(top_bytes))
+#else
+                find_test(top_bytes, top_name, None)
+#endif
+                writing.write(b"".join(found))
+                found.clear()
+
+#if JOBS
+                pool = concurrent.futures.ThreadPoolExecutor($JOBS)
+                scans = dict()  # the Dirs listed, or being listed, ahead of time
+
+#endif
+                walks = [(top_bytes, 1)]  # each Dir to walk, with the Depth inside it
+#if PRUNES
+                if top_bytes in prunes:
+                    walks = list()
+                prunes.clear()
+
+#endif
+                while walks:
+
+#if JOBS
+                    # List the next few Dirs, while testing the next Dir
+
+                    for walk in walks[-$AHEAD:]:
+                        if walk not in scans:
+                            scans[walk] = pool.submit(find_scan, dirpath=walk[0])
+
+                    walk = walks.pop()
+                    (dirpath, depth) = walk
+                    scan = scans.pop(walk)
+  #if DROP_DEEPER
+                    if depth > $MAXDEPTH:
+                        continue  # such as '-maxdepth 0'
   #endif
-  #if TAKE_HIDDEN
-                dirnames[:] = list(_ for _ in dirnames if _.startswith("."))
+                    listing = scan.result()
+#else
+                    # List the next Dir
+
+                    (dirpath, depth) = walks.pop()
+  #if DROP_DEEPER
+                    if depth > $MAXDEPTH:
+                        continue  # such as '-maxdepth 0'
   #endif
-                dirnames[:] = sorted(dirnames)
-                for dirname in dirnames:
-                    found_dir = os.path.join(dirpath, dirname)
-                    print(found_dir)
+                    listing = find_scan(dirpath)
+#endif
+                    if listing is None:
+                        continue  # such as a Dir we may not read
+
+                    (dir_entries, file_entries) = listing
+                    dir_entries.sort(key=lambda _: _.name)
+                    file_entries.sort(key=lambda _: _.name)
+
+                    # Test the Dirs inside, then the Files inside
+
+                    for entry in dir_entries:
+                        find_test(entry.path, entry.name, entry)
+                    for entry in file_entries:
+                        find_test(entry.path, entry.name, entry)
+
+                    writing.write(b"".join(found))
+                    found.clear()
+
+                    # Walk the Dirs inside, in order, before the Dirs pending,
+                    # but don't walk the Symlinks to Dirs, like 'find -P'
+
+                    dir_entries = list(_ for _ in dir_entries if not _.is_symlink())
+#if PRUNES
+                    dir_entries = list(_ for _ in dir_entries if _.path not in prunes)
+                    prunes.clear()
 
 #endif
-#if DROP_FILES
+#if DROP_DEEPER
+                    if depth < $MAXDEPTH:  # don't walk deeper
+                        for entry in reversed(dir_entries):
+                            walks.append((entry.path, depth + 1))
 #else
-  #if DROP_HIDDEN
-                filenames[:] = list(_ for _ in filenames if not _.startswith("."))
-  #endif
-  #if TAKE_HIDDEN
-                filenames[:] = list(_ for _ in filenames if _.startswith("."))
-  #endif
-                filenames[:] = sorted(filenames)
-                for filename in filenames:
-                    found_file = os.path.join(dirpath, filename)
-                    print(found_file)
+                    for entry in reversed(dir_entries):
+                        walks.append((entry.path, depth + 1))
+#endif
+#if JOBS
+
+                pool.shutdown()
+#endif
+
+        def find_scan(dirpath):
+            """Sort the Entries inside a Dir into Dirs and not Dirs, else return None"""
+
+            dir_entries = list()  # the Dirs, and the Symlinks to Dirs, like 'os.walk'
+            file_entries = list()
+            try:
+                with os.scandir(dirpath) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False  # such as a Symlink we may not follow
+                        if is_dir:
+                            dir_entries.append(entry)
+                        else:
+                            file_entries.append(entry)
+            except OSError:
+                return None  # such as a Dir we may not read
+
+            return (dir_entries, file_entries)
+
+#if EMPTY
+        def find_empty(entry):
+            """Say if a Dir holds nothing, or a File holds no Bytes"""
+
+            if entry.is_dir(follow_symlinks=False):
+                try:
+                    with os.scandir(entry.path) as entries:
+                        for _ in entries:
+                            return False
+                except OSError:
+                    return False  # such as a Dir we may not read
+
+                return True
+
+            if entry.is_file(follow_symlinks=False):
+                return not entry.stat(follow_symlinks=False).st_size
+
+            return False
+
+#endif
+#if TOP_ENTRY
+        class FindTopEntry:
+            """Stand in for the 'os.DirEntry' of the Top, and stat it at most once"""
+
+            def __init__(self, path):
+                self.path = path
+                self.stat_result = None
+
+            def stat(self, follow_symlinks):
+                if self.stat_result is None:
+                    self.stat_result = os.lstat(self.path)
+                return self.stat_result
+
+            def is_dir(self, follow_symlinks):
+                return stat.S_ISDIR(self.stat(follow_symlinks=False).st_mode)
+
+            def is_file(self, follow_symlinks):
+                return stat.S_ISREG(self.stat(follow_symlinks=False).st_mode)
+
+            def is_symlink(self):
+                return stat.S_ISLNK(self.stat(follow_symlinks=False).st_mode)
 
 #endif
         find(top=$TOP)
@@ -222,16 +859,25 @@ def argv__to_find_py(argv):
     py = _scraps_.c_pre_process(
         py,
         cpp_vars=dict(
-            drop_deeper=drop_deeper,
-            drop_dirs=drop_dirs,
-            drop_files=drop_files,
-            drop_hidden=drop_hidden,
-            take_hidden=take_hidden,
+            jobs=args.jobs,
+            drop_deeper=(args.maxdepth is not None),
+            refs=refs,
+            regexes=("re.compile(" in refs_py),
+            clock=("time.time()" in refs_py),
+            prunes=("find_prune(" in test_py),
+            empty=("find_empty(" in test_py),
+            stats=("entry" in test_py),
+            top_entry=("entry" in test_py),
         ),
     )
 
+    py = py.replace("$REFS", refs_py.replace("\n", "\n" + 4 * " "))
+    py = py.replace("$TEST", test_py)
     py = py.replace("$TOP", _scraps_.as_py_value(top))
     py = py.replace("$SHLINE", shline)
+    if args.jobs:
+        py = py.replace("$JOBS", str(args.jobs))
+        py = py.replace("$AHEAD", str(4 * args.jobs))
     if args.maxdepth is None:
         assert "$MAXDEPTH" not in py
     else:
@@ -240,68 +886,16 @@ def argv__to_find_py(argv):
     return py
 
 
-def exit_unless_simple_find(
-    args, drop_deeper, drop_dirs, drop_files, drop_hidden, take_hidden
-):
-    """Reject obvious Find option contradictions, as if untranslatable"""
-
-    if args.name and (args.name != ".?*"):
-        sys.stderr.write(
-            "find.py: error: argument -name {}: choose {!r}\n".format(
-                _scraps_.shlex_quote(args.name), _scraps_.shlex_quote(".?*")
-            )
-        )
-
-        sys.exit(2)
-
-    if args.type and (args.type != "d"):
-        sys.stderr.write(
-            "find.py: error: argument -type {}: choose d\n".format(
-                _scraps_.shlex_quote(args.name)
-            )
-        )
-
-        sys.exit(2)
-
-    assert not (drop_dirs and drop_files)
-    assert not (drop_hidden and take_hidden)
-
-    if not drop_dirs:
-        if args.not_:
-            sys.stderr.write("find.py: error: argument -not {}: choose -not -type d\n")
-
-            sys.exit(2)
-
-    if not drop_hidden:
-        for argname in "prune o print".split():
-            if vars(args)[argname]:
-                sys.stderr.write(
-                    "find.py: error: argument -{}: choose -prune -o -print\n".format(
-                        argname
-                    )
-                )
-
-                sys.exit(2)
-
-
 def shlex_join_find(args):
     """Form a stylish copy of the Shell Find Command Line"""
 
     shline = "find"
-    if args.maxdepth:
+    if args.maxdepth is not None:
         shline += " -maxdepth {}".format(args.maxdepth)
-    if args.name:
-        shline += " -name {}".format(_scraps_.shlex_quote(args.name))
-    if args.not_:
-        shline += " -not"
-    if args.prune:
-        shline += " -prune"
-    if args.o:
-        shline += " -o"
-    if args.type:
-        shline += " -type {}".format(args.type)
-    if args.print:
-        shline += " -print"
+    for word in args.words:
+        shline += " {}".format(_scraps_.shlex_quote(word))
+    if args.jobs:
+        shline += " --jobs {}".format(args.jobs)
 
     return shline
 
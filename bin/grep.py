@@ -17,6 +17,7 @@ optional arguments:
 quirks:
   searches for Python reg ex such as 'a|b|c', not Shell reg ex such as r'a\|b\|c'
   requires '-a', because i haven't found the spec on which lines Grep drops by default
+  writes as each line matches, but 'shell2py --fast grep' writes per 64 KiB of Stdin
   doesn't take '-h' as '--h', because Shell Grep defines '-h' and '-H' differently
   began life as a Generalised Regular Expression Parser (GREP)
 
@@ -27,6 +28,7 @@ examples:
   cat file |grep.py -anw 'def|jkl|pqr'
 """
 
+import functools
 import sys
 import textwrap
 
@@ -53,6 +55,7 @@ def parse_grep_args(argv):
     return args
 
 
+@functools.lru_cache(maxsize=None)
 def compile_grep_argdoc():
     """Convert the Grep Main Doc to an ArgParse Parser"""
 
@@ -88,7 +91,15 @@ def compile_grep_argdoc():
     return parser
 
 
-def argv__to_grep_py(argv):
+def argv__to_grep_fast_py(argv):
+    """Write the Python for a Grep ArgV that runs fast, else print some Help and quit"""
+
+    py = argv__to_grep_py(argv, fast=True)
+
+    return py
+
+
+def argv__to_grep_py(argv, fast=False):
     """Write the Python for a Grep ArgV, else print some Help and quit"""
 
     args = parse_grep_args(argv)
@@ -110,9 +121,9 @@ def argv__to_grep_py(argv):
     # Form the Python
 
     if args.n:
-        py = grep_an(pyregex)
+        py = grep_an_fast(pyregex) if fast else grep_an(pyregex)
     else:
-        py = grep_a(pyregex)
+        py = grep_a_fast(pyregex) if fast else grep_a(pyregex)
 
     return py
 
@@ -143,22 +154,39 @@ def grep_a(pyregex):
         """
     ).strip()
 
-    py = py.replace("$PYREGEX", as_py_binary_regex(pyregex))
+    py = py.replace("$PYREGEX", _scraps_.as_py_binary_regex(pyregex))
 
     return py
 
 
-def as_py_binary_regex(pyregex):
-    """Repr as rb"..." when easy, else fall back to Python Repr"""
+def grep_a_fast(pyregex):
 
-    rep = _scraps_.as_py_value(pyregex)
-    if b"\\" in pyregex:
-        if not pyregex.endswith(b"\\"):
-            if b'"' not in pyregex:
-                chars = pyregex.decode()
-                rep = 'rb"{}"'.format(chars)
+    py = textwrap.dedent(
+        """
+        import re
+        import sys
 
-    return rep
+        def grep(pyregex):
+
+            search = re.compile(pyregex).search
+            writing = sys.stdout.buffer
+            while True:
+                lines = sys.stdin.buffer.readlines(0x10000)  # about 64 KiB at a time
+                if not lines:
+
+                    break
+
+                data = b"".join(_ for _ in lines if search(_))
+                writing.write(data)
+                writing.flush()
+
+        grep($PYREGEX)
+        """
+    ).strip()
+
+    py = py.replace("$PYREGEX", _scraps_.as_py_binary_regex(pyregex))
+
+    return py
 
 
 def grep_an(pyregex):
@@ -189,7 +217,43 @@ def grep_an(pyregex):
         """
     ).strip()
 
-    py = py.replace("$PYREGEX", as_py_binary_regex(pyregex))
+    py = py.replace("$PYREGEX", _scraps_.as_py_binary_regex(pyregex))
+
+    return py
+
+
+def grep_an_fast(pyregex):
+
+    py = textwrap.dedent(
+        """
+        import re
+        import sys
+
+        def grep(pyregex):
+
+            search = re.compile(pyregex).search
+            writing = sys.stdout.buffer
+            lines = 0
+            while True:
+                chunk = sys.stdin.buffer.readlines(0x10000)  # about 64 KiB at a time
+                if not chunk:
+
+                    break
+
+                datas = list()
+                for (index, line) in enumerate(chunk, start=lines + 1):
+                    if search(line):
+                        datas.append(str(index).encode() + b":" + line)
+
+                lines += len(chunk)
+                writing.write(b"".join(datas))
+                writing.flush()
+
+        grep($PYREGEX)
+        """
+    ).strip()
+
+    py = py.replace("$PYREGEX", _scraps_.as_py_binary_regex(pyregex))
 
     return py
 
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
 """
-usage: ls.py [--help] [-1] [-l] [-C] [-h] [--headings] [--full-time] [-X | -f] [-a]
-             [-d] [-F]
+usage: ls.py [--help] [-1] [-l] [-C] [-h] [--headings] [--full-time] [--ndjson]
+             [--lookahead N] [-X | -f] [-a] [-d] [-F] [-R] [--jobs N]
              [TOP ...]
 
 show the files and dirs inside some dirs
@@ -18,11 +18,15 @@ optional arguments:
   -h               count as metric binary size enough ('BKMGTPEZY') in rows of '-l'
   --headings       insert a row of headings before rows of '-l'
   --full-time      stamp date/time more precise than hour/minute into rows of '-l'
+  --ndjson         print one Json Object per file or dir, in place of each row of '-l'
+  --lookahead N    pad rows of '-l' to fit the first N rows, then widen as needed
   -X               sort by ext (default: sort by name)
   -f               do not sort
   -a, --all        hide no names (by showing the names that start with the '.' dot)
   -d, --directory  show the names of dirs (not the files and dirs inside)
   -F, --classify   add '*/=>@' suffixes to exec, dir, socket, door, or sym
+  -R, --recursive  show the files and dirs inside the dirs inside, and so on
+  --jobs N         list as many as N dirs at a time (default: 1)
 
 quirks:
   shows columns like Linux, separated by two spaces, not equal width like Mac
@@ -32,12 +36,21 @@ quirks:
   defines '--headings', and doesn't infer '-l' from '--full-time', unlike Linux
   actually doesn't yet know how to mark socket as '=', nor door as '>', for '-F'
   writes less code when given just dirs, or just files, or just one top
+  defines '--jobs', and still prints the dirs in order of the tops, unlike Linux
+  defines '--ndjson', and prints each 'dir:' heading as a Json Object too
+  still sorts all rows in memory before printing any for '--ndjson', unless given '-f'
+  defines '--lookahead', and then may widen a column part way down, unlike Linux
+  writes each list of names in one go, and each name of '-f' sans print, for '--fast'
 
 examples:
   ls.py --help  # show this help message and exit
   ls -1  # show each file or dir inside the current dir
   ls -C  # ask explicitly for the default output
   ls *  # show each file, then show each file or dir inside each child dir
+  ls --jobs 8 -l */  # show the files and dirs inside many dirs, 8 dirs at a time
+  ls -R --jobs 8  # show the files and dirs inside every dir inside, 8 dirs at a time
+  ls -l --ndjson -f  # show the details of each file or dir, as soon as found
+  ls -l --lookahead 0 -f  # show the details of each file or dir, padded as found
 """
 
 # reserve 'ls --he' to quit via 'ambiguous option: --he could match --help, --headings'
@@ -47,10 +60,14 @@ examples:
 
 import argparse
 import datetime as dt
+import functools
 import grp
+import itertools
+import json
 import os
 import pathlib
 import pwd
+import re
 import stat
 import sys
 
@@ -59,6 +76,8 @@ import _scraps_
 
 DENT = 4 * " "  # solve only the case of in/out/dent'ed by 4 columns
 
+LS_ARGS_BY_ARGV = dict()  # the Args parsed for the Facts, kept till the Code runs
+
 
 def main():
 
@@ -71,16 +90,39 @@ def parse_ls_args(argv):
     parser = compile_ls_argdoc()
 
     args = parser.parse_args(argv[1:])
-    _scraps_.args_cancel_pairs(args)
+    _scraps_.args_cancel_pairs(args, exclusions="jobs lookahead".split())
     if args.help:
         parser.print_help()
         sys.exit(0)
 
+    if args.jobs is not None:
+
+        try:
+            args.jobs = int(args.jobs)
+            if args.jobs < 1:
+                raise ValueError("{} is less than 1".format(args.jobs))
+        except ValueError as exc:
+            sys.stderr.write("ls.py: error: argument --jobs: {}\n".format(exc))
+
+            sys.exit(2)
+
+    if args.lookahead is not None:
+
+        try:
+            args.lookahead = int(args.lookahead)
+            if args.lookahead < 0:
+                raise ValueError("{} is less than 0".format(args.lookahead))
+        except ValueError as exc:
+            sys.stderr.write("ls.py: error: argument --lookahead: {}\n".format(exc))
+
+            sys.exit(2)
+
     expand_ls_args(args)
 
     return args
 
 
+@functools.lru_cache(maxsize=None)
 def compile_ls_argdoc():
     """Convert the Ls Main Doc to an ArgParse Parser"""
 
@@ -127,6 +169,18 @@ def compile_ls_argdoc():
         help="stamp date/time more precise than hour/minute into rows of '-l'",
     )
 
+    parser.add_argument(
+        "--ndjson",
+        action="count",
+        help="print one Json Object per file or dir, in place of each row of '-l'",
+    )
+
+    parser.add_argument(
+        "--lookahead",
+        metavar="N",
+        help="pad rows of '-l' to fit the first N rows, then widen as needed",
+    )
+
     group_Xf = parser.add_mutually_exclusive_group()
     group_Xf.add_argument(
         "-X", action="count", help="sort by ext (default: sort by name)"
@@ -154,6 +208,19 @@ def compile_ls_argdoc():
         help="add '*/=>@' suffixes to exec, dir, socket, door, or sym",
     )
 
+    parser.add_argument(
+        "-R",
+        "--recursive",
+        action="count",
+        help="show the files and dirs inside the dirs inside, and so on",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        metavar="N",
+        help="list as many as N dirs at a time (default: 1)",
+    )
+
     _scraps_.parser_patch_usage(parser, metavar="TOP", nargs="*")
 
     _scraps_.exit_unless_doc_eq(parser)
@@ -170,7 +237,8 @@ def expand_ls_args(args):
     args.last_top = args.some_tops[-1]  # last is first is only, when just one exists
 
     # Choose exactly one of the '[-1 | -l | -C]' output styles
-    # Quietly ignore the "-h", "--headings", or "--full-time" hints, except when "-l"
+    # Quietly ignore the "-h", "--headings", "--full-time", "--ndjson", or
+    # "--lookahead" hints, except when "-l"
 
     styles = list()
     if args.cells:
@@ -193,25 +261,157 @@ def expand_ls_args(args):
     if not args.cells and not args.long_rows and not args.C:
         args.tall_columns = 1
 
+    # Pad the Rows of '-l' into Columns, else print each Row as a Json Object,
+    # one per line, in the way of '-1'
+
+    args.padded_rows = args.long_rows and not args.ndjson
+    args.json_rows = args.long_rows and args.ndjson
+
+    # Print the padded Rows of '-l' sooner, with less Memory, when given a Lookahead
+
+    args.table_rows = args.padded_rows and (args.lookahead is None)
+    args.lookahead_rows = args.padded_rows and (args.lookahead is not None)
+
+    args.cells_or_json_rows = args.cells or args.json_rows
+
+    # Show the Dirs themselves, not what's inside, when both '-d' and '-R'
+
+    if args.directory:
+        args.recursive = 0
+
+    # Scan Dirs for the Entries of each Name, only when more than Names shown,
+    # or when walking into the Dirs inside
+
+    args.scandir = args.classify or args.long_rows or args.recursive
+
+    # Print each Name as the Dir yields it, when not sorting, not packing Columns,
+    # not listing Dirs in parallel, and not walking into the Dirs inside
+
+    args.stream = (
+        args.cells_or_json_rows and args.f and not args.jobs and not args.recursive
+    )
+
+    # Pad and print each Row of '-l --lookahead' as the Dir yields it, in the same way
+
+    args.stream_rows = (
+        args.lookahead_rows and args.f and not args.jobs and not args.recursive
+    )
+
+    args.streaming = args.stream or args.stream_rows
+
+    # Stat in the Workers too, when listing Dirs in parallel to show more than Names
+
+    args.prestat = args.jobs and (args.classify or args.long_rows)
+
     # Parse the example Args now, to choose what Code to run later
 
     topdirs = list()
     topfiles = list()
+    top_stats = dict()
 
     for top in args.some_tops:
-        _ = os.stat(top)  # raises OSError if 'top' not found
+        top_stat = os.stat(top)  # raises OSError if 'top' not found
+        top_stats[top] = top_stat
 
-        if os.path.isdir(top):  # '.isdir' may have changed since 'stat.S_ISDIR'
+        if stat.S_ISDIR(top_stat.st_mode):  # same as 'os.path.isdir', but no 2nd Stat
             topdirs.append(top)
         else:
             topfiles.append(top)
 
     args.topdirs = topdirs
     args.topfiles = topfiles
+    args.top_stats = top_stats  # kept for the Code we run, when run in-process
 
     args.len_args_topdirs_gt_1 = len(topdirs) > 1
     args.len_args_topfiles_gt_1 = len(topfiles) > 1
 
+    args.topdir_headings = args.len_args_topdirs_gt_1 or args.recursive
+
+
+def argv__to_ls_facts(argv):
+    """Pick out the Facts of the Filesystem that choose which Ls Python to write"""
+
+    args = parse_ls_args(argv)
+    facts = dict(topdirs=args.topdirs, topfiles=args.topfiles)
+
+    LS_ARGS_BY_ARGV.clear()
+    LS_ARGS_BY_ARGV[tuple(argv)] = args
+
+    return facts
+
+
+def argv__to_ls_args(argv):
+    """Reuse the Args parsed just now for the Facts, else parse the ArgV again"""
+
+    args = LS_ARGS_BY_ARGV.get(tuple(argv))
+    if args is None:
+        args = parse_ls_args(argv)
+
+    return args
+
+
+def argv_py__to_ls_exec(argv, py):
+    """Pass the TOPs and their Stats outside the Python, when run in-process"""
+
+    args = LS_ARGS_BY_ARGV.pop(tuple(argv), None)
+    if args is None:
+        args = parse_ls_args(argv)
+
+    # Call with the Names of the TOP Lists, not with their Literals
+
+    (py1, calling) = args__to_top_level_ls_py(args)
+
+    exec_py = py
+    if py1.startswith("some_tops_ls("):  # the only Call given Lists of TOPs
+        (head, sep, tail) = exec_py.rpartition("\n")
+        assert tail.startswith(py1.partition("$")[0]), (py1, tail[:80])
+
+        exec_call = ls_py_inject_tops(py1, args=args, literal=False)
+        exec_py = head + sep + exec_call
+
+    # Look up the Stats of the TOPs, don't stat them again
+
+    for name in "top topfile name".split():
+        exec_py = exec_py.replace(
+            " = os.stat({})\n".format(name), " = TOP_STATS[{}]\n".format(name)
+        )
+        exec_py = exec_py.replace(
+            "pathlib.Path({})".format(name), "TOP_ENTRIES[{}]".format(name)
+        )
+
+    # Bind the Names
+
+    top_entries = dict()
+    if "TOP_ENTRIES[" in exec_py:
+        for (top, top_stat) in args.top_stats.items():
+            top_entries[top] = TopEntry(top_stat)
+
+    globals_ = dict(
+        TOPFILES=args.topfiles,
+        TOPDIRS=args.topdirs,
+        TOPS=args.some_tops,
+        TOP=args.last_top,
+        TOP_STATS=args.top_stats,
+        TOP_ENTRIES=top_entries,
+    )
+
+    return (exec_py, globals_)
+
+
+class TopEntry:
+    """Stand in for the 'pathlib.Path' of a TOP, but give back the Stat taken before"""
+
+    __slots__ = ("stat_result",)
+
+    def __init__(self, stat_result):
+        self.stat_result = stat_result
+
+    def is_dir(self):
+        return stat.S_ISDIR(self.stat_result.st_mode)
+
+    def stat(self):
+        return self.stat_result
+
 
 #
 # Form the Python of Ls
@@ -223,7 +423,7 @@ def argv__to_ls_py(argv):
 
     # Open up
 
-    args = parse_ls_args(argv)
+    args = argv__to_ls_args(argv)
 
     # Don't yet translate Usage: '[--headings] [--full-time]'
 
@@ -239,6 +439,57 @@ def argv__to_ls_py(argv):
     return ls_py
 
 
+def argv__to_ls_fast_py(argv):
+    """Write the Python for a Ls Argv that runs fast, else print some Help and quit"""
+
+    ls_py = argv__to_ls_py(argv)
+    if ls_py is None:
+        return
+
+    fast_py = ls_py_tune_fast(ls_py)
+
+    return fast_py
+
+
+def ls_py_tune_fast(py):
+    """Write each List of Names in one go, and each Name found one by one, sans Print"""
+
+    # Join the Names, and write them all at once
+
+    py1 = py
+    py1 = re.sub(
+        r"^( *)for name in (.+):\n\1    print\(name\)$",
+        r'\1sys.stdout.write("".join((_ + "\\n") for _ in \2))',
+        py1,
+        flags=re.MULTILINE,
+    )
+
+    # Write each Name found one by one, such as by '-f', without the costs of Print
+
+    py1 = re.sub(
+        r"^( *)print\(name\)$",
+        r'\1sys.stdout.write(name + "\\n")',
+        py1,
+        flags=re.MULTILINE,
+    )
+
+    if py1 == py:
+        return py
+
+    # Import Sys, if not imported already
+
+    lines = py1.splitlines()
+    if "import sys" not in lines:
+        index = 0
+        while lines[index].startswith("import ") and (lines[index] < "import sys"):
+            index += 1
+        lines.insert(index, "import sys")
+
+    py2 = "\n".join(lines)
+
+    return py2
+
+
 def args__to_top_level_ls_py(args):
     """Write the Top Level of Ls Python"""
 
@@ -272,11 +523,11 @@ def args__to_top_level_ls_py(args):
         else:
             assert args.topdirs, args.tops
 
-            if args.len_args_topdirs_gt_1:
+            if args.topdir_headings:
 
                 py1 = "some_tops_ls(topdirs=$TOPS)"
                 calling_to = "def some_tops_ls(tops, topfiles, topdirs):"
-                calling_as_if = "def some_tops_ls(tops):"
+                calling_as_if = "def some_tops_ls(topdirs):"
 
             else:
 
@@ -298,23 +549,17 @@ def args__to_whole_ls_py(args, py1, calling):
     """Fill out the missing Source Lines of Ls Py"""
 
     argnames = sorted(vars(args).keys())
-    module_py = _scraps_.module_name__readlines(__name__)
+    index = _scraps_.module_name__index(__name__)
     (calling_to, calling_as_if) = calling
 
     # Form enough more sourcelines, but keep only the chosen options
 
-    py2 = py1
-    py2 = edit_ls_py(py=py2, args=args, argnames=argnames, module_py=module_py)
-    assert py2 != py1, py1
-
-    py3 = py2
-    py3 = edit_ls_py(py=py3, args=args, argnames=argnames, module_py=module_py)
-
-    py4 = py3
-    py4 = edit_ls_py(py=py4, args=args, argnames=argnames, module_py=module_py)
-
-    py5 = py4
-    py5 = edit_ls_py(py=py5, args=args, argnames=argnames, module_py=module_py)
+    py5 = _scraps_.py_pick_closure(
+        py=py1,
+        index=index,
+        edit=lambda py: edit_ls_py(py, args=args, argnames=argnames),
+    )
+    assert py5 != py1, py1
 
     # Expand a single call of 'def some_names_ls' inline
 
@@ -332,9 +577,9 @@ def args__to_whole_ls_py(args, py1, calling):
 
     py7 = py6
 
-    if not args.classify and not args.long_rows:
+    if not args.scandir:
 
-        py7 = reduce_ls_py_stats_to_names(py=py7, module_py=module_py)
+        py7 = reduce_ls_py_stats_to_names(py=py7, index=index)
 
     py7 = py7.replace(", args=args)", ")")
 
@@ -353,7 +598,9 @@ def args__to_whole_ls_py(args, py1, calling):
             )
 
             def_some_names_ls = "def some_names_ls(names):"
-            py7 = _scraps_.py_dedent(py=py7, line=def_some_names_ls, truthy=True)
+            truthy_by_line = dict()
+            truthy_by_line[def_some_names_ls] = True
+            py7 = _scraps_.py_dedent_lines(py7, truthy_by_line=truthy_by_line)
 
         py7 = py7.replace(
             "\n\n\n    for name in sorted(names):\n",
@@ -369,27 +616,26 @@ def args__to_whole_ls_py(args, py1, calling):
 
     if py1 == "one_dir_ls()":
 
-        if not args.cells:
+        if (not args.cells) or (py7.count("\ndef ") > 1):  # inline only a last Def
             py7 = py7.replace("(top)", "()")
         else:
             def_one_dir = "def one_dir_ls(top):"
             assert def_one_dir in py7
-            py7 = _scraps_.py_dedent(py7, line=def_one_dir, truthy=True)
+            truthy_by_line = dict()
+            truthy_by_line[def_one_dir] = True
+            py7 = _scraps_.py_dedent_lines(py7, truthy_by_line=truthy_by_line)
             py7 = py7.replace("import os\n\n\n\n", "import os\n\n")
             py7 = py7.replace("(top)", "()")
             py7 = py7.replace("os.stat(os.path.join(top, name))", "os.stat(name)")
             py7 = py7.replace("\n\n\none_dir_ls()", "")
 
-        py7 = py7.replace(
-            "sub_stats = {_: os.stat(os.path.join(top, _)) for _ in names}",
-            "sub_stats = {_: os.stat(_) for _ in names}",
-        )
+        py7 = py7.replace("pathlib.Path(top, ", "pathlib.Path(")
 
         # TODO: less custom styling
 
     py7 = py7.replace(calling_to, calling_as_if)
 
-    py7 = _scraps_.py_add_imports(py=py7, module_py=module_py)
+    py7 = _scraps_.py_add_imports(py=py7, index=index)
 
     py7 = py7.replace("\n\n\nnames = os.listdir()\n", "\n\nnames = os.listdir()\n")
     py7 = py7.replace(
@@ -404,10 +650,17 @@ def args__to_whole_ls_py(args, py1, calling):
     while "\n\n\n    " in py8:  # also strip extra blank lines from inside Def's
         py8 = py8.replace("\n\n\n    ", "\n\n    ")
 
-    py8 = py8.replace("$TOPFILES", _scraps_.as_py_value(args.topfiles))
-    py8 = py8.replace("$TOPDIRS", _scraps_.as_py_value(args.topdirs))
-    py8 = py8.replace("$TOPS", _scraps_.as_py_value(args.some_tops))
-    py8 = py8.replace("$TOP", _scraps_.as_py_value(args.last_top))
+    py8 = py8.replace("(args.jobs)", "({})".format(_scraps_.as_py_value(args.jobs)))
+    late_import = "import concurrent.futures  # import late, only when given '--jobs'"
+    py8 = py8.replace("\n    {}\n\n".format(late_import), "\n")  # once is enough
+    py8 = py8.replace(late_import, "import concurrent.futures")
+    if args.jobs:
+        py8 = py8.replace("-4 * args.jobs :", "-{}:".format(4 * args.jobs))
+    py8 = py8.replace(
+        "lookahead=args.lookahead)",
+        "lookahead={})".format(_scraps_.as_py_value(args.lookahead)),
+    )
+    py8 = ls_py_inject_tops(py8, args=args)
 
     return py8
 
@@ -417,51 +670,110 @@ def args__to_whole_ls_py(args, py1, calling):
     # TODO: calculate DocStrings by Args
 
 
-def edit_ls_py(py, args, argnames, module_py):
-    """Fill out the next layer of missing Source Lines of an Ls Py"""
+def ls_py_inject_tops(py, args, literal=True):
+    """Replace the $TOP Marks with Literal Values, else with the Names of Globals"""
+
+    py1 = py
+
+    for (mark, value) in [
+        ("$TOPFILES", args.topfiles),
+        ("$TOPDIRS", args.topdirs),
+        ("$TOPS", args.some_tops),
+        ("$TOP", args.last_top),
+    ]:
+        rep = _scraps_.as_py_value(value) if literal else mark[len("$") :]
+        py1 = py1.replace(mark, rep)
+
+    return py1
+
+
+def edit_ls_py(py, args, argnames):
+    """Keep only the chosen options of a piece of Ls Py"""
 
     py1 = py
-    py1 = _scraps_.py_pick_lines(py=py1, module_py=module_py)
     py1 = _scraps_.py_dedent_args(py=py1, args=args, argnames=argnames)
 
-    if not args.classify and not args.long_rows:
+    if not args.scandir:
         py1 = py1.replace("stats_item_print", "print")
 
     return py1
 
 
-def reduce_ls_py_stats_to_names(py, module_py):
+def reduce_ls_py_stats_to_names(py, index):
     """Reduce Stats to Names"""
 
     py1 = py
 
+    # Set up to apply the changes as if inside a larger blank area
+
+    dented1 = "\n".join((DENT + _) for _ in py1.splitlines())
+    enclosed1 = "\n" + dented1 + "\n"
+
+    unrolled1 = enclosed1[len("\n") : -len("\n")]
+    undented1 = "\n".join(_[len(DENT) :] for _ in unrolled1.splitlines())
+
+    assert undented1 == py1
+
+    # Apply the changes without regard to indentation
+
+    enclosed2 = enclosed1
+    for (stripped_old, stripped_new) in index.rewrites:
+        enclosed2 = enclosed2.replace(stripped_old, stripped_new)
+
+    # Pick the changed text out of the larger blank area
+
+    unrolled2 = enclosed2[len("\n") : -len("\n")]
+    undented2 = "\n".join(_[len(DENT) :] for _ in unrolled2.splitlines())
+
+    py1 = undented2
+
+    # Strip trailing spaces in any line
+
+    py1 = "\n".join(_.rstrip() for _ in py1.splitlines())
+
+    # Change partial lines
+
+    py1 = py1.replace("one_stat_ls(name=", "one_name_ls(")
+
+    return py1
+
+
+def module_py__to_ls_rewrites(module_py):
+    """List the Pairs of Changes that reduce Stats to Names, once per Ls Source"""
+
     # List the pairs of changes
 
     diffs = """
 -         tops_stats = dict()
 +
--             tops_stats[top] = os.stat(top)
+-             tops_stats[top] = pathlib.Path(top)
 +             _ = os.stat(top)
 -         some_stats_ls(stats=tops_stats)
 +         some_names_ls(names=tops)
 -             topfiles_stats = dict()
 +
--                 topfiles_stats[topfile] = os.stat(topfile)
+-                 topfiles_stats[topfile] = pathlib.Path(topfile)
 +                 _ = os.stat(topfile)
 -             some_stats_ls(stats=topfiles_stats)
 +             some_names_ls(names=topfiles)
--                 topdir_sub_stats = {_: os.stat(os.path.join(topdir, _)) for _ in names}
-+
--                 some_stats_ls(stats=topdir_sub_stats)
-+                 some_names_ls(names)
--             top_item = (top, os.stat(top))
+-                             item = (dot, pathlib.Path(topdir, dot))
++                             name = dot
+-                             item = (entry.name, entry)
++                             name = entry.name
+-                         (_, topdir_sub_stats) = next(scans)
++                         (_, names) = next(scans)
+-                         topdir_sub_stats = one_dir_scan(topdir, args=args)
++                         names = one_dir_scan(topdir, args=args)
+-                     some_stats_ls(stats=topdir_sub_stats)
++                     some_names_ls(names)
+-             top_item = (top, pathlib.Path(top))
 +             _ = os.stat(top)
 -             stats_item_print(top_item, args=args)
 +             print(top)
--         sub_stats = {_: os.stat(os.path.join(top, _)) for _ in names}
-+
--         some_stats_ls(stats=sub_stats)
-+         some_names_ls(names)
+-                     item = (dot, pathlib.Path(top, dot))
++                     name = dot
+-             some_stats_ls(stats=sub_stats)
++             some_names_ls(names)
 - def some_stats_ls(stats, args):
 + def some_names_ls(names, args):
 -             for item in stats.items():
@@ -492,7 +804,7 @@ def reduce_ls_py_stats_to_names(py, module_py):
 +
 - def one_stat_ls(name, args):
 + def one_name_ls(name, args):
--         item = (name, os.stat(name))
+-         item = (name, pathlib.Path(name))
 +         _ = os.stat(name)
 -         stats_item_print(item, args=args)
 +         print(name)
@@ -505,6 +817,8 @@ def reduce_ls_py_stats_to_names(py, module_py):
 
     assert (len(difflines) % 2) == 0, len(difflines)
 
+    rewrites = list()
+
     stripped_olds_set = set()
     pairs = list(zip(difflines, difflines[1:]))[::2]
     for pair in pairs:
@@ -521,17 +835,7 @@ def reduce_ls_py_stats_to_names(py, module_py):
         if new == "\n\n":
             new = "\n"
 
-        # Set up to apply the change as if inside a larger blank area
-
-        dented1 = "\n".join((DENT + _) for _ in py1.splitlines())
-        enclosed1 = "\n" + dented1 + "\n"
-
-        unrolled1 = enclosed1[len("\n") : -len("\n")]
-        undented1 = "\n".join(_[len(DENT) :] for _ in unrolled1.splitlines())
-
-        assert undented1 == py1
-
-        # Apply the change without regard to indentation
+        # Plan to apply the change without regard to indentation
 
         stripped_old = old
         stripped_old = stripped_old.replace(", args)", ")")
@@ -543,30 +847,13 @@ def reduce_ls_py_stats_to_names(py, module_py):
         stripped_new = stripped_new.replace("stats_item_print", "print")
         stripped_new = stripped_new.strip() + "\n"
 
-        enclosed2 = enclosed1
-        if stripped_old in stripped_olds_set:
-            if stripped_old:
-                assert stripped_old not in py1, stripped_old
-        else:
-            stripped_olds_set.add(stripped_old)
-            enclosed2 = enclosed1.replace(stripped_old, stripped_new)
-
-        # Pick the changed text out of the larger blank area
-
-        unrolled2 = enclosed2[len("\n") : -len("\n")]
-        undented2 = "\n".join(_[len(DENT) :] for _ in unrolled2.splitlines())
-
-        py1 = undented2
+        # Keep only the first change of each Old, because it replaces every copy
 
-    # Strip trailing spaces in any line
-
-    py1 = "\n".join(_.rstrip() for _ in py1.splitlines())
-
-    # Change partial lines
-
-    py1 = py1.replace("one_stat_ls(name=", "one_name_ls(")
+        if stripped_old not in stripped_olds_set:
+            stripped_olds_set.add(stripped_old)
+            rewrites.append((stripped_old, stripped_new))
 
-    return py1
+    return rewrites
 
 
 def some_tops_ls(tops, topfiles, topdirs, args):  # noqa Flake8 C901 too complex
@@ -575,7 +862,7 @@ def some_tops_ls(tops, topfiles, topdirs, args):  # noqa Flake8 C901 too complex
 
         tops_stats = dict()
         for top in tops:
-            tops_stats[top] = os.stat(top)
+            tops_stats[top] = pathlib.Path(top)
         some_stats_ls(stats=tops_stats)
 
     if not args.directory:
@@ -584,63 +871,255 @@ def some_tops_ls(tops, topfiles, topdirs, args):  # noqa Flake8 C901 too complex
 
             topfiles_stats = dict()
             for topfile in topfiles:
-                topfiles_stats[topfile] = os.stat(topfile)
+                topfiles_stats[topfile] = pathlib.Path(topfile)
             some_stats_ls(stats=topfiles_stats)
 
         if args.topdirs:
 
+            if args.jobs:
+                walks = topdirs[::-1]  # the Dirs still to list, with the next Dir last
+                scans = dirs_scan_ahead(walks, args=args)
+
             for (index, topdir) in enumerate(topdirs):
-                if args.topfiles:
-                    print()
-                    print("{}:".format(topdir))
-                if not args.topfiles:
-                    if args.len_args_topdirs_gt_1:
-                        if index:
-                            print()
+                if args.json_rows:
+                    if args.topfiles:
+                        print(json.dumps(dict(dir=topdir)))
+                    if not args.topfiles:
+                        if args.topdir_headings:
+                            print(json.dumps(dict(dir=topdir)))
+                if not args.json_rows:
+                    if args.topfiles:
+                        print()
                         print("{}:".format(topdir))
+                    if not args.topfiles:
+                        if args.topdir_headings:
+                            if index:
+                                print()
+                            print("{}:".format(topdir))
 
-                if args.all:
-                    names = list([os.curdir, os.pardir] + os.listdir(topdir))
-                if not args.all:
-                    names = os.listdir(topdir)
-                    names = list(_ for _ in names if not _.startswith("."))
+                if args.stream:
+                    if args.all:
+                        for dot in (os.curdir, os.pardir):
+                            item = (dot, pathlib.Path(topdir, dot))
+                            stats_item_print(item, args=args)
+                    with os.scandir(topdir) as entries:
+                        for entry in entries:
+                            if not args.all:
+                                if entry.name.startswith("."):
+                                    continue
+                            item = (entry.name, entry)
+                            stats_item_print(item, args=args)
+
+                if not args.streaming:
+
+                    if args.jobs:
+                        (_, topdir_sub_stats) = next(scans)
+                    if not args.jobs:
+                        topdir_sub_stats = one_dir_scan(topdir, args=args)
+
+                    some_stats_ls(stats=topdir_sub_stats)
+
+                    if args.recursive:
+                        dir_walk_ls(topdir, stats=topdir_sub_stats, args=args)
+
+                if args.stream_rows:
+                    items = dir_items_scan(topdir, args=args)
+                    rows = (stats_item_row(_, args=args) for _ in items)
+                    rows_align_print(rows, lookahead=args.lookahead)
+
+
+def dir_walk_ls(top, stats, args):  # noqa Flake8 C901 too complex
+
+    # List each Dir inside, then each Dir inside of that, and so on
+
+    walks = list()  # the Dirs still to list, with the next Dir last
+    if args.jobs:
+        scans = dirs_scan_ahead(walks, args=args)
+    subdirs = stats_subdirs(top, stats=stats, args=args)
+
+    while True:
+        walks.extend(subdirs[::-1])
+
+        if not walks:
+
+            break
+
+        # List the next Dir
+
+        if args.jobs:
+            (subdir, sub_stats) = next(scans)
+        if not args.jobs:
+            subdir = walks.pop()
+            sub_stats = one_dir_scan(subdir, args=args)
+
+        if args.json_rows:
+            print(json.dumps(dict(dir=subdir)))
+        if not args.json_rows:
+            print()
+            print("{}:".format(subdir))
+
+        some_stats_ls(stats=sub_stats)
+
+        subdirs = stats_subdirs(subdir, stats=sub_stats, args=args)
+
+
+def dirs_scan_ahead(walks, args):
+    """Yield each Dir popped off the end of the Walks, while listing up to 4N ahead"""
 
-                topdir_sub_stats = {_: os.stat(os.path.join(topdir, _)) for _ in names}
-                some_stats_ls(stats=topdir_sub_stats)
+    import concurrent.futures  # import late, only when given '--jobs'
 
+    with concurrent.futures.ThreadPoolExecutor(args.jobs) as pool:
+        scans = dict()  # the Dirs listed, or being listed, ahead of time
+        while walks:
+            for walk in walks[-4 * args.jobs :]:
+                if walk not in scans:
+                    scans[walk] = pool.submit(one_dir_scan, walk, args=args)
+            walk = walks.pop()
+            yield (walk, scans.pop(walk).result())
 
-def one_dir_ls(top, args):
+
+def stats_subdirs(top, stats, args):
+
+    # Choose the same order of dirs as the order of names shown
+
+    names = list(stats.keys())
+    if args.X:
+        names.sort(key=lambda _: (pathlib.Path(_).suffix, _))
+    if not args.f:
+        if not args.X:
+            names.sort()
+
+    # Walk into the dirs, but not into links to dirs, nor back up
+
+    subdirs = list()
+    for name in names:
+        if name not in (os.curdir, os.pardir):
+            if stats[name].is_dir(follow_symlinks=False):
+                subdir = os.path.join(top, name)
+                subdirs.append(subdir)
+
+    return subdirs
+
+
+def one_dir_scan(top, args):  # noqa Flake8 C901 too complex
+
+    if not args.scandir:
+        try:
+            if args.all:
+                names = list([os.curdir, os.pardir] + os.listdir(top))
+            if not args.all:
+                names = os.listdir(top)
+                names = list(_ for _ in names if not _.startswith("."))
+        except OSError as exc:
+            names = list()
+            sys.stderr.write(
+                "ls.py: cannot open directory {!r}: {}\n".format(top, exc.strerror)
+            )
+
+        return names
+
+    if args.scandir:
+        sub_stats = dict()
+        if args.all:
+            for dot in (os.curdir, os.pardir):
+                sub_stats[dot] = pathlib.Path(top, dot)
+        try:
+            with os.scandir(top) as entries:
+                for entry in entries:
+                    if not args.all:
+                        if entry.name.startswith("."):
+                            continue
+                    sub_stats[entry.name] = entry
+                    if args.prestat:
+                        _ = entry.stat()  # stat in this Worker, keep it in the Entry
+        except OSError as exc:
+            sub_stats = dict()
+            sys.stderr.write(
+                "ls.py: cannot open directory {!r}: {}\n".format(top, exc.strerror)
+            )
+
+        return sub_stats
+
+
+def dir_items_scan(top, args):
+
+    # Yield each Name with its Entry, as soon as the Dir yields it
+
+    if args.all:
+        for dot in (os.curdir, os.pardir):
+            yield (dot, pathlib.Path(top, dot))
+    with os.scandir(top) as entries:
+        for entry in entries:
+            if not args.all:
+                if entry.name.startswith("."):
+                    continue
+            yield (entry.name, entry)
+
+
+def one_dir_ls(top, args):  # noqa Flake8 C901 too complex
 
     if args.directory:
 
-        if not args.long_rows:
+        if not args.padded_rows:
 
-            top_item = (top, os.stat(top))
+            top_item = (top, pathlib.Path(top))
             stats_item_print(top_item, args=args)
 
-        if args.long_rows:
+        if args.padded_rows:
 
             print("total .")  # TODO: count blocks of 512B each
 
-            top_item = (top, os.stat(top))
+            top_item = (top, pathlib.Path(top))
             row = stats_item_row(top_item, args=args)
             print("  ".join(row))
 
     if not args.directory:
 
-        if args.all:
-            names = list([os.curdir, os.pardir] + os.listdir(top))
-        if not args.all:
-            names = os.listdir(top)
-            names = list(_ for _ in names if not _.startswith("."))
+        if args.stream:
+            if args.all:
+                for dot in (os.curdir, os.pardir):
+                    item = (dot, pathlib.Path(top, dot))
+                    stats_item_print(item, args=args)
+            with os.scandir(top) as entries:
+                for entry in entries:
+                    if not args.all:
+                        if entry.name.startswith("."):
+                            continue
+                    item = (entry.name, entry)
+                    stats_item_print(item, args=args)
 
-        sub_stats = {_: os.stat(os.path.join(top, _)) for _ in names}
-        some_stats_ls(stats=sub_stats)
+        if not args.streaming:
+
+            if not args.scandir:
+                if args.all:
+                    names = list([os.curdir, os.pardir] + os.listdir(top))
+                if not args.all:
+                    names = os.listdir(top)
+                    names = list(_ for _ in names if not _.startswith("."))
+
+            if args.scandir:
+                sub_stats = dict()
+                if args.all:
+                    for dot in (os.curdir, os.pardir):
+                        sub_stats[dot] = pathlib.Path(top, dot)
+                with os.scandir(top) as entries:
+                    for entry in entries:
+                        if not args.all:
+                            if entry.name.startswith("."):
+                                continue
+                        sub_stats[entry.name] = entry
+
+            some_stats_ls(stats=sub_stats)
+
+        if args.stream_rows:
+            items = dir_items_scan(top, args=args)
+            rows = (stats_item_row(_, args=args) for _ in items)
+            rows_align_print(rows, lookahead=args.lookahead)
 
 
 def some_stats_ls(stats, args):  # noqa Flake8 C901 too complex
 
-    if args.cells:
+    if args.cells_or_json_rows:
 
         if args.f:
             for item in stats.items():
@@ -656,9 +1135,7 @@ def some_stats_ls(stats, args):  # noqa Flake8 C901 too complex
                 for item in sorted(stats.items()):
                     stats_item_print(item, args=args)
 
-    if args.long_rows:
-
-        print("total .")  # TODO: count blocks of 512B each
+    if args.table_rows:
 
         rows = list()
         if args.f:
@@ -678,8 +1155,27 @@ def some_stats_ls(stats, args):  # noqa Flake8 C901 too complex
                     row = stats_item_row(item, args=args)
                     rows.append(row)
 
-        chars = format_rows_as_columns(rows)
-        print(chars)
+        if not rows:
+            print("total 0")  # such as an empty Dir
+        if rows:
+            print("total .")  # TODO: count blocks of 512B each
+            chars = format_rows_as_columns(rows)
+            print(chars)
+
+    if args.lookahead_rows:
+
+        if args.f:
+            items = stats.items()
+        if args.X:
+            items = sorted(
+                stats.items(), key=lambda _: (pathlib.Path(_[0]).suffix, _[0])
+            )
+        if not args.f:
+            if not args.X:
+                items = sorted(stats.items())
+
+        rows = (stats_item_row(_, args=args) for _ in items)
+        rows_align_print(rows, lookahead=args.lookahead)
 
     if args.tall_columns:
 
@@ -718,23 +1214,23 @@ def some_stats_ls(stats, args):  # noqa Flake8 C901 too complex
 
 def one_stat_ls(name, args):
 
-    if not args.long_rows:
+    if not args.padded_rows:
 
-        item = (name, os.stat(name))
+        item = (name, pathlib.Path(name))
         stats_item_print(item, args=args)
 
-    if args.long_rows:
+    if args.padded_rows:
 
         print("total .")  # TODO: count blocks of 512B each
 
-        item = (name, os.stat(name))
+        item = (name, pathlib.Path(name))
         row = stats_item_row(item, args=args)
         print("  ".join(row))
 
 
 def stats_item_print(item, args):
 
-    if not args.classify:
+    if not args.scandir:
 
         assert False
 
@@ -746,33 +1242,57 @@ def stats_item_print(item, args):
             marked_name = stats_item_format(item, args=args)
         print(marked_name)
 
-    if args.long_rows:
+    if args.padded_rows:
 
         assert False
 
+    if args.json_rows:
+
+        item_dict = stats_item_dict(item)
+        print(json.dumps(item_dict))
+
+
+def stats_item_dict(item):
+
+    (item_name, item_entry) = item
+    item_stat = item_entry.stat()
+
+    item_dict = dict(
+        perms=st_mode_filemode(item_stat.st_mode),
+        links=item_stat.st_nlink,
+        user=st_uid_format(item_stat.st_uid),
+        group=st_gid_format(item_stat.st_gid),
+        size=item_stat.st_size,
+        mtime=item_stat.st_mtime,
+        name=item_name,
+    )
+
+    return item_dict
+
 
 def stats_item_row(item, args):
 
-    (item_name, item_stat) = item
+    (item_name, item_entry) = item
+    item_stat = item_entry.stat()
 
     st_mode = item_stat.st_mode
-    perms = stat.filemode(st_mode)
+    perms = st_mode_filemode(st_mode)
     islnk = stat.S_ISLNK(st_mode)
     _ = islnk  # FIXME
 
     st_nlink = item_stat.st_nlink
     links = "." if (st_nlink == 1) else str(st_nlink)
 
-    gid_uid = (os.getgid(), os.getuid())
+    gid_uid = os_gid_uid()
 
     st_gid = item_stat.st_gid
     st_uid = item_stat.st_uid
     st_gid_uid = (st_gid, st_uid)
 
-    user_name = pwd.getpwuid(st_uid).pw_name
+    user_name = st_uid_format(st_uid)
     user = "." if (st_gid_uid == gid_uid) else user_name
 
-    group_name = grp.getgrgid(st_gid).gr_name
+    group_name = st_gid_format(st_gid)
     group = "." if (st_gid_uid == gid_uid) else group_name
 
     st_size = item_stat.st_size
@@ -782,11 +1302,7 @@ def stats_item_row(item, args):
         len_bytes = "." if perms.startswith("d") else st_size_format(st_size)
 
     st_mtime = item_stat.st_mtime
-    item_datetime = dt.datetime.fromtimestamp(st_mtime)
-    stamp = item_datetime.strftime("%h %d %H:%M")
-    if item_datetime.year != dt.datetime.now().year:
-        stamp = item_datetime.strftime("%h %d %Y")
-        # TODO: "%h %d %Y" for more than 6 months away
+    stamp = st_mtime_format(st_mtime)
 
     if not args.classify:
         name = item[0]
@@ -798,6 +1314,66 @@ def stats_item_row(item, args):
     return row
 
 
+@functools.lru_cache(maxsize=1)
+def os_gid_uid():
+
+    gid_uid = (os.getgid(), os.getuid())
+
+    return gid_uid
+
+
+@functools.lru_cache(maxsize=None)
+def st_mode_filemode(st_mode):
+
+    perms = stat.filemode(st_mode)
+
+    return perms
+
+
+@functools.lru_cache(maxsize=None)
+def st_uid_format(st_uid):
+
+    user_name = pwd.getpwuid(st_uid).pw_name
+
+    return user_name
+
+
+@functools.lru_cache(maxsize=None)
+def st_gid_format(st_gid):
+
+    group_name = grp.getgrgid(st_gid).gr_name
+
+    return group_name
+
+
+def st_mtime_format(st_mtime):
+
+    st_mtime_minute = int(st_mtime // 60)  # Local Time Zones shift by whole Minutes
+    stamp = st_mtime_minute_format(st_mtime_minute)
+
+    return stamp
+
+
+@functools.lru_cache(maxsize=None)
+def st_mtime_minute_format(st_mtime_minute):
+
+    item_datetime = dt.datetime.fromtimestamp(60 * st_mtime_minute)
+    stamp = item_datetime.strftime("%h %d %H:%M")
+    if item_datetime.year != now_year():
+        stamp = item_datetime.strftime("%h %d %Y")
+        # TODO: "%h %d %Y" for more than 6 months away
+
+    return stamp
+
+
+@functools.lru_cache(maxsize=1)
+def now_year():
+
+    year = dt.datetime.now().year
+
+    return year
+
+
 def st_size_format(st_size):
 
     multiples = "KMGTPEZY"  # kibi, mebi, gibi, tibi, pebi, exbi, zebi, yebi
@@ -818,7 +1394,7 @@ def st_size_format(st_size):
 
     # Else format exact binary multiples
 
-    logki = next(_ for _ in range(len(marks)) if st_size < (1 << (10 * _))) - 1
+    logki = (st_size.bit_length() - 1) // 10
     factor = 1 << (10 * logki)
     mark = marks[logki]
 
@@ -836,12 +1412,11 @@ def st_size_format(st_size):
 
     if div < 10:
 
-        for tenth in range(1, 10):
-            more = (tenth * factor) // 10
+        tenth = -((-10 * mod) // factor)  # least Tenth such that Tenth * Factor >= Mod
+        if tenth < 10:
             str_st_size = "{}.{}{}".format(div, tenth, mark)
-            if more >= mod:
 
-                return str_st_size
+            return str_st_size
 
     # Else format rounded up to two, three, or four digits times a binary multiple
 
@@ -855,22 +1430,24 @@ def stats_item_format(item, args):
     if not args.classify:
         assert False
 
-    (item_name, item_stat) = item
-    st_mode = item_stat.st_mode
-
-    perms = stat.filemode(st_mode)
-    islnk = stat.S_ISLNK(st_mode)
+    (item_name, item_entry) = item
 
     if args.classify:
 
-        if perms.startswith("d"):
+        if item_entry.is_dir():  # no Stat when the Dir Entry knows its Type
             mark = "/"
-        elif "x" in perms:
-            mark = "*"
-        elif islnk:
-            mark = "@"  # TODO: pass tests of this
         else:
-            mark = ""  # wrong mark when it should be socket as '=', or door as '>'
+            st_mode = item_entry.stat().st_mode
+
+            perms = stat.filemode(st_mode)
+            islnk = stat.S_ISLNK(st_mode)
+
+            if "x" in perms:
+                mark = "*"
+            elif islnk:
+                mark = "@"  # TODO: pass tests of this
+            else:
+                mark = ""  # wrong mark when socket as '=', or door as '>'
 
     marked_name = item_name + mark
 
@@ -907,6 +1484,46 @@ def format_rows_as_columns(rows):
     return chars
 
 
+def rows_align_print(rows, lookahead):
+    """Print a Total, then Rows of Cells padded to fit the first few Rows, or wider"""
+
+    justs = (
+        str.ljust,
+        str.rjust,
+        str.ljust,
+        str.ljust,
+        str.rjust,
+        str.ljust,
+        str.ljust,
+    )
+    # justs for (perms, links, user, group, len_bytes, stamp, marked_name)
+
+    # Print 'total 0' when no Rows come, such as an empty Dir, as the Table does
+
+    first_rows = list(itertools.islice(rows, 1))
+    rows = itertools.chain(first_rows, rows)
+
+    if not first_rows:
+        print("total 0")  # such as an empty Dir
+    if first_rows:
+        print("total .")
+
+    # Choose Widths to fit the first few Rows
+
+    ahead_rows = list(itertools.islice(rows, lookahead))
+
+    widths = list(0 for _ in justs)
+    for row in ahead_rows:
+        widths = list(max(w, len(c)) for (w, c) in zip(widths, row))
+
+    # Print each Row, and widen a Column only when a later Row needs it
+
+    for row in itertools.chain(ahead_rows, rows):
+        widths = list(max(w, len(c)) for (w, c) in zip(widths, row))
+        padded_row = list(j(c, w) for (j, c, w) in zip(justs, row, widths))
+        print("  ".join(padded_row).rstrip())
+
+
 def pack_cells_in_columns(cells, tty_columns, sep):
     """Pack Cells into Columns with Sep's between them"""
 
@@ -918,31 +1535,15 @@ def pack_cells_in_columns(cells, tty_columns, sep):
     columns_by_x = list()
 
     if strs:
-        len_strs = len(strs)
-        for max_y in range(len_strs + 1):
-            assert max_y < len_strs
-
-            matrix_height = max_y + 1
-            matrix_width = (len_strs + matrix_height - 1) // matrix_height
-            assert (matrix_width * matrix_height) >= len_strs
-
-            shafts = list()
-            for x in range(matrix_width):
-                shaft = strs[(x * matrix_height) :][:matrix_height]
-                shaft = (shaft + (matrix_height * [""]))[:matrix_height]
-                shafts.append(shaft)
-
-            columns_by_x = list()
-            for shaft in shafts:
-                shaft_columns = max(len(_) for _ in shaft)
-                columns_by_x.append(shaft_columns)
-
-            matrix_columns = sum(columns_by_x)
-            matrix_columns += (matrix_width - 1) * len(sep)
-
-            if matrix_columns < tty_columns:
+        widths = list(len(_) for _ in strs)
+        (matrix_height, columns_by_x) = widths_fit_matrix(
+            widths, tty_columns=tty_columns, sep=sep
+        )
 
-                break
+        for x in range(len(columns_by_x)):
+            shaft = strs[(x * matrix_height) : ((x + 1) * matrix_height)]
+            shaft = (shaft + (matrix_height * [""]))[:matrix_height]
+            shafts.append(shaft)
 
     # Join the Chars
 
@@ -961,6 +1562,120 @@ def pack_cells_in_columns(cells, tty_columns, sep):
     return chars
 
 
+def widths_fit_matrix(widths, tty_columns, sep):
+    """Find the shortest Matrix Height, and its Column Widths, inside the Tty Columns"""
+
+    len_widths = len(widths)
+    sum_widths = sum(widths)
+
+    # Skip the Heights too short to fit, as measured by their Mean Column Widths
+
+    def may_fit(height):
+        matrix_width = (len_widths + height - 1) // height
+        min_columns = (sum_widths + height - 1) // height
+        min_columns += (matrix_width - 1) * len(sep)
+        return min_columns < tty_columns
+
+    (lo, hi) = (1, len_widths)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if may_fit(mid):
+            hi = mid
+        else:
+            lo = mid + 1
+
+    # Tabulate the Max Width of each aligned Block of 2**J Widths, for each J
+
+    maxes_by_j = [widths]
+    while len(maxes_by_j[-1]) > 1:
+        maxes = maxes_by_j[-1]
+        maxes_by_j.append(
+            [a if (a > b) else b for (a, b) in zip(maxes[::2], maxes[1::2])]
+        )
+
+    min_maxes_by_j = list(min(_) for _ in maxes_by_j)
+
+    # Measure each taller Height, till one fits
+
+    for matrix_height in range(lo, len_widths + 2):
+        assert matrix_height <= len_widths
+
+        columns_by_x = widths_fit_columns(
+            maxes_by_j,
+            min_maxes_by_j=min_maxes_by_j,
+            matrix_height=matrix_height,
+            tty_columns=tty_columns,
+            sep=sep,
+        )
+        if columns_by_x:
+
+            break
+
+    return (matrix_height, columns_by_x)
+
+
+def widths_fit_columns(maxes_by_j, min_maxes_by_j, matrix_height, tty_columns, sep):
+    """List the Column Widths of a Matrix Height, else None if too wide to fit"""
+
+    len_widths = len(maxes_by_j[0])
+    matrix_width = (len_widths + matrix_height - 1) // matrix_height
+
+    # Skip the Height when its Columns can't fit, each as wide as the least Max
+    # of the aligned Blocks that each Column must hold
+
+    full_columns = len_widths // matrix_height
+    min_columns = full_columns * min_maxes_by_j[(matrix_height + 1).bit_length() - 2]
+    min_columns += (matrix_width - 1) * len(sep)
+
+    last_height = len_widths % matrix_height
+    if last_height:
+        min_columns += min_maxes_by_j[(last_height + 1).bit_length() - 2]
+
+    if min_columns >= tty_columns:
+
+        return None
+
+    # Sum the Widths of the Columns, but stop when too wide
+
+    matrix_columns = (matrix_width - 1) * len(sep)
+
+    columns_by_x = list()
+    for x in range(matrix_width):
+        start = x * matrix_height
+        stop = min(start + matrix_height, len_widths)
+        shaft_columns = maxes_range_max(maxes_by_j, start=start, stop=stop)
+
+        columns_by_x.append(shaft_columns)
+        matrix_columns += shaft_columns
+        if matrix_columns >= tty_columns:
+
+            return None
+
+    return columns_by_x
+
+
+def maxes_range_max(maxes_by_j, start, stop):
+    """Find the Max Width of a Range, from the fewest aligned Blocks that cover it"""
+
+    range_max = 0
+    for maxes in maxes_by_j:
+        if start >= stop:
+
+            break
+
+        if start & 1:
+            range_max = max(range_max, maxes[start])
+            start += 1
+        if stop & 1:
+            stop -= 1
+            range_max = max(range_max, maxes[stop])
+
+        start >>= 1
+        stop >>= 1
+
+    return range_max
+
+
 if __name__ == "__main__":
     main()
 
@@ -1,81 +1,95 @@
 #!/usr/bin/env python3
 
 """
-usage: shell2py.py [-h] VERB [WORD [WORD ...]]
+usage: shell2py.py [-h] [--serve] [--batch [FILE]] [--fast] VERB [WORD [WORD ...]]
 
 say in Python what you said in Shell
 
 positional arguments:
-  VERB        the first word of a Shell line, being the program to run
-  WORD        another word of a Shell line, being an arg of the program to run
+  VERB            the first word of a Shell line, being the program to run
+  WORD            another word of a Shell line, being an arg of the program to run
 
 optional arguments:
-  -h, --help  show this help message and exit
+  -h, --help      show this help message and exit
+  --serve         keep every Verb warm, and translate for other Shell2Py's, till ⌃C
+  --batch [FILE]  translate each line of a Shell script (default: stdin) into 1 module
+  --fast          write Python tuned to run fast, in place of Python tuned to teach
+
+quirks:
+  asks a 'shell2py --serve' at 'bin/__pycache__/shell2py.sock' first, if running
+  translates in-process when no Server is running, or when the Server is stale
+  translates in-process always, when called as 'shell2py.py' not as 'shell2py'
+  skips blank and '#' comment lines of '--batch', but reports lines it can't translate
+  reuses Python written before, but keeps no more than 1024 in 'bin/__pycache__/'
+  counts the hits and misses of that cache, and reports them when '--serve' quits
+  writes the same Python with or without '--fast', for Verbs that don't tune for speed
 
 examples:
   shell2py -h  # show this help message and exit
   ls.py -1  # show the files and dirs inside a dir
   shell2py ls -1  # show how to say 'ls -1' in Python
+  shell2py --fast ls -1  # show how to say 'ls -1' in Python that runs faster
   echo.py a 'b c'  # show some words
   shell2py echo a 'b c'  # show how your Shell splits apart the chars you're typing
   ls bin/*  # show the verbs of Bash that this revision of Shell2Py will explain
+  shell2py --batch ops.sh >ops.py  # translate a whole Shell script, in one process
 """
 
 import argparse
-import glob
+import contextlib
+import importlib
+import io
+import json
 import os
+import shlex
+import socket
 import sys
+import traceback
 
-import _scraps_
-
-import dig
+import _client_
 
-import echo
-
-import find
+import _scraps_
 
-import grep
 
-import less
+def main():
 
-import ls
+    argv = sys.argv
 
-import scp
+    # Serve, if asked to serve
 
-import ssh
+    if argv[1:2] == ["--serve"]:
+        parse_shell2py_args(argv)
+        serve_shell2py()
 
-import tac
+        return
 
-import tar
+    # Translate many Shell lines, if asked to translate many
 
+    if argv[1:2] == ["--batch"]:
+        args = parse_shell2py_args(argv)
+        batch_shell2py(args.batch)
 
-def main():
+        return
 
-    argv = sys.argv
-    altv = sys.argv[1:]
+    # Else translate just one Shell line, in-process
 
-    # TODO: import just the modules needed for this run of the main args
+    translate_shell2py_argv(argv)
 
-    _ = (dig, echo, find, grep, less, ls, scp, ssh, tac, tar)
 
-    # Discover the Python modules of Shell Verbs near here
+def translate_shell2py_argv(argv):
+    """Print the Python for a Shell2Py ArgV, else print some Help and quit"""
 
-    file_dir = os.path.dirname(os.path.abspath(__file__))
+    # Discover the Python modules of Shell Verbs near here, but don't import them yet
 
-    with_dir = os.getcwd()
-    os.chdir(file_dir)
-    try:
-        hits = glob.glob("*.py")
-    finally:
-        os.chdir(with_dir)
+    module_name_by_verb = load_verbs_manifest()
 
     # Quit now if the Verb not found
 
-    verbs = sorted(os.path.splitext(_)[0] for _ in hits if not _.startswith("_"))
-    verbs = list(_ for _ in verbs if _ != "shell2py")
+    verbs = sorted(module_name_by_verb.keys())
     str_verbs = ", ".join(repr(_) for _ in verbs)
 
     args = parse_shell2py_args(argv)
+    altv = argv[2:] if args.fast else argv[1:]
 
     if args.verb not in verbs:
         sys.stderr.write(
@@ -86,13 +100,20 @@ def main():
         )
         sys.exit(2)
 
+    # Import just the one module needed for this run of the main args
+
+    name = module_name_by_verb[args.verb]
+    module = importlib.import_module(name)
+
     # Write the Python for a Shell Argv, else print some Help and quit
 
-    name = args.verb
     argv__to_py_name = "argv__to_{}_py".format(name)
-    module = sys.modules[name]
     argv__to_py = getattr(module, argv__to_py_name)
 
+    if args.fast:
+        argv__to_fast_py_name = "argv__to_{}_fast_py".format(name)
+        argv__to_py = getattr(module, argv__to_fast_py_name, argv__to_py)
+
     py = _scraps_.module_name__to_main_py(name, argv__to_py=argv__to_py, argv=altv)
 
     # Print the Python formed
@@ -100,6 +121,356 @@ def main():
     print(py)
 
 
+def argv__to_reply(argv):
+    """Translate a Shell2Py ArgV in-process, but catch its Stdout, Stderr, and Exit"""
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+
+    returncode = 0
+    translated = False
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            translate_shell2py_argv(argv)
+            translated = True
+        except SystemExit as exc:
+            returncode = exc.code
+            if returncode is None:
+                returncode = 0
+            elif not isinstance(returncode, int):
+                sys.stderr.write("{}\n".format(returncode))
+                returncode = 1
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+
+    reply = dict(
+        returncode=returncode,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+        translated=translated,
+    )
+
+    return reply
+
+
+#
+# Translate many Shell lines into one Python module, in one process
+#
+
+
+def batch_shell2py(file):
+    """Print one Python module with a section per Shell line, and report the misses"""
+
+    # Read the Shell lines
+
+    if file == "-":
+        shlines = sys.stdin.read().splitlines()
+    else:
+        with open(file) as reading:
+            shlines = reading.read().splitlines()
+
+    # Write one section per Shell line
+
+    tries = 0
+    misses = 0
+    for (lineno, shline) in join_shell_continuations(shlines):
+        words = shlex_split_simple_else_none(shline)
+        if words == []:  # such as a blank line, or a '#' comment line
+            continue
+
+        tries += 1
+        if tries > 1:
+            print()
+            print()
+
+        if words is None:
+            misses += 1
+            batch_print_miss(lineno, shline=shline, why="Shell syntax too complex")
+
+            continue
+
+        reply = argv__to_reply(["shell2py"] + words)
+
+        if not reply["translated"]:
+            misses += 1
+            why = reply_why_untranslated(reply)
+            batch_print_miss(lineno, shline=shline, why=why)
+
+            continue
+
+        batch_print_section(lineno, shline=shline, py=reply["stdout"])
+
+    # Exit nonzero if any Shell line not translated
+
+    if misses:
+        sys.stdout.flush()
+        sys.stderr.write(
+            "shell2py.py: {} of {} Shell lines not translated\n".format(misses, tries)
+        )
+
+        sys.exit(1)
+
+
+def join_shell_continuations(shlines):
+    """Join each Shell line ended by a backslash to the next, and keep line numbers"""
+
+    pairs = list()
+
+    lineno = None
+    joined = ""
+    for (index, shline) in enumerate(shlines):
+        if lineno is None:
+            lineno = index + 1
+
+        if shline.endswith("\\"):
+            joined += shline[: -len("\\")]
+
+            continue
+
+        joined += shline
+        pairs.append((lineno, joined))
+
+        lineno = None
+        joined = ""
+
+    if lineno is not None:
+        pairs.append((lineno, joined))
+
+    return pairs
+
+
+def shlex_split_simple_else_none(shline):
+    """Split a Shell line into Words, else None if it needs more than one command"""
+
+    try:
+        words = shlex.split(shline, comments=True)
+
+        lex = shlex.shlex(shline, posix=True, punctuation_chars=True)
+        lex.whitespace_split = True
+        lex.commenters = "#"
+        lex_words = list(lex)
+    except ValueError:
+        return None  # such as "No closing quotation"
+
+    for word in lex_words:
+        if set(word) <= set("();<>|&"):  # such as '|', '&&', '>', ';'
+            return None
+
+    return words
+
+
+def reply_why_untranslated(reply):
+    """Say in one line why a Shell line was not translated"""
+
+    lines = (reply["stderr"]).strip().splitlines()
+    if lines:
+        why = lines[-1]
+    elif reply["stdout"]:
+        why = "printed help, not Python"
+    else:
+        why = "exit {}".format(reply["returncode"])
+
+    return why
+
+
+def batch_print_section(lineno, shline, py):
+    """Print one numbered section of the one Python module"""
+
+    print("#")
+    print("# {}: {}".format(lineno, shline.strip()))
+    print("#")
+    print()
+    print()
+    print(py.rstrip())
+
+
+def batch_print_miss(lineno, shline, why):
+    """Mark a Shell line not translated, in the module, and at Stderr"""
+
+    batch_print_section(lineno, shline=shline, py="# not translated: " + why)
+
+    sys.stdout.flush()
+    sys.stderr.write("shell2py.py: line {}: {}\n".format(lineno, why))
+    sys.stderr.flush()
+
+
+#
+# Translate for Clients over a Unix Socket
+#
+
+
+def serve_shell2py():
+    """Keep every Verb warm, and translate ArgV's for Clients, till ⌃C"""
+
+    socket_path = _client_.shell2py_socket_path()
+    _scraps_.cache_dir_path()  # make the Dir of the Socket
+    if not socket_path:
+        sys.stderr.write(
+            "shell2py.py: error: socket path too long, try a shorter dir\n"
+        )
+        sys.exit(1)
+
+    exit_if_shell2py_serving(socket_path)
+    warm_shell2py_verbs()
+
+    stamps = stamp_source_files()
+
+    # Answer each Client in turn, till the Source changes, or till ⌃C
+
+    sys.stderr.write("shell2py.py: serving at {}\n".format(socket_path))
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(socket_path)
+        server.listen()
+        try:
+            while True:
+                (conn, _) = server.accept()
+                with conn:
+                    stale = stamp_source_files() != stamps
+                    serve_one_shell2py_client(conn, stale=stale)
+
+                if stale:
+                    sys.stderr.write("shell2py.py: quitting, because source changed\n")
+
+                    break
+
+        except KeyboardInterrupt:
+            sys.stderr.write("\n")
+        finally:
+            os.remove(socket_path)
+
+    counts = _scraps_.PY_CACHE_COUNTS
+    sys.stderr.write(
+        "shell2py.py: served {} hits and {} misses of the cache of Python\n".format(
+            counts["hits"], counts["misses"]
+        )
+    )
+
+
+def exit_if_shell2py_serving(socket_path):
+    """Quit if another Server is running, else clear the way to take its place"""
+
+    if os.path.exists(socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(socket_path)
+            except OSError:
+                os.remove(socket_path)
+            else:
+                sys.stderr.write(
+                    "shell2py.py: error: already serving at {}\n".format(socket_path)
+                )
+                sys.exit(1)
+
+
+def warm_shell2py_verbs():
+    """Import every Verb, and build its Parser, and read its Source Lines"""
+
+    module_name_by_verb = load_verbs_manifest()
+    for name in module_name_by_verb.values():
+        module = importlib.import_module(name)
+
+        compile_argdoc = getattr(module, "compile_{}_argdoc".format(name), None)
+        if compile_argdoc:
+            compile_argdoc()
+
+        _scraps_.module_name__readlines(name)
+
+
+def serve_one_shell2py_client(conn, stale):
+    """Translate one ArgV for one Client, in the Client's Current Dir and Env"""
+
+    data = _client_.socket_recv_till_eof(conn)
+    try:
+        request = json.loads(data)
+    except ValueError:
+        return  # such as a Probe that connects and hangs up, to ask if we're serving
+
+    reply = dict(stale=True)
+    if not stale:
+        env = request.get("env", dict())
+        client_env = dict((_, env.get(_)) for _ in _client_.ENV_NAMES)
+        with_env = dict((_, os.getenv(_)) for _ in _client_.ENV_NAMES)
+
+        with_cwd = os.getcwd()
+        try:
+            os.chdir(request["cwd"])
+            environ_update(client_env)
+            reply = argv__to_reply(request["argv"])
+        except OSError:
+            reply = dict(stale=True)  # such as a Cwd that we can't visit
+        finally:
+            os.chdir(with_cwd)
+            environ_update(with_env)
+
+    try:
+        conn.sendall(json.dumps(reply).encode() + b"\n")
+    except OSError:
+        pass  # such as a Client no longer waiting
+
+
+def environ_update(env):
+    """Set each Env Var to its Value, else unset it when its Value is None"""
+
+    for (name, value) in env.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+def stamp_source_files():
+    """Stamp the Py Files near here, to notice when any change"""
+
+    file_dir = os.path.dirname(os.path.abspath(__file__))
+
+    stamps = dict()
+    stamps[file_dir] = os.stat(file_dir).st_mtime_ns
+    for filename in sorted(os.listdir(file_dir)):
+        if filename.endswith(".py"):
+            path = os.path.join(file_dir, filename)
+            stamps[path] = os.stat(path).st_mtime_ns
+
+    return stamps
+
+
+#
+# Discover the Verbs
+#
+
+
+def load_verbs_manifest():
+    """Map each Verb to its Module Name, rescanning the Dir only when it changes"""
+
+    file_dir = os.path.dirname(os.path.abspath(__file__))
+    cache_dir = _scraps_.cache_dir_path()  # made before we look at the Dir Mtime
+    manifest_path = os.path.join(cache_dir, "shell2py-verbs.json")
+
+    dir_mtime_ns = os.stat(file_dir).st_mtime_ns
+
+    # Trust the Manifest on Disk, when it was built from this same Dir Listing
+
+    manifest = _scraps_.read_json_else_none(manifest_path)
+    if manifest and (manifest.get("dir_mtime_ns") == dir_mtime_ns):
+        module_name_by_verb = manifest["module_name_by_verb"]
+
+        return module_name_by_verb
+
+    # Else rebuild the Manifest from one Listing of the Dir, no imports, no 'chdir'
+
+    module_name_by_verb = dict()
+    for filename in sorted(os.listdir(file_dir)):
+        (module_name, ext) = os.path.splitext(filename)
+        if (ext == ".py") and not module_name.startswith("_"):
+            if module_name != "shell2py":
+                module_name_by_verb[module_name] = module_name
+
+    manifest = dict(dir_mtime_ns=dir_mtime_ns, module_name_by_verb=module_name_by_verb)
+    _scraps_.write_json_if_able(manifest_path, value=manifest)
+
+    return module_name_by_verb
+
+
 def parse_shell2py_args(argv):
     """Convert a Shell2Py Sys ArgV to an Args Namespace, or print some Help and quit"""
 
@@ -107,9 +478,33 @@ def parse_shell2py_args(argv):
 
     _scraps_.parse_left_help_args(argv, doc=__doc__)
 
+    # Take '--serve' only by itself, and '--batch' with at most one File
+
+    if argv[1:2] in (["--serve"], ["--batch"]):
+        serve = argv[1] == "--serve"
+        max_argc = 2 if serve else 3
+
+        if argv[max_argc:]:
+            sys.stderr.write(
+                "shell2py.py: error: unrecognized arguments: {}\n".format(
+                    " ".join(argv[max_argc:])
+                )
+            )
+            sys.exit(2)
+
+        batch = None if serve else (argv[2] if argv[2:] else "-")
+        args = argparse.Namespace(serve=serve, batch=batch, fast=False, verb=None)
+
+        return args
+
+    # Take '--fast' only before the Verb
+
+    fast = argv[1:2] == ["--fast"]
+    altv = argv[1:] if fast else argv
+
     # Require Verb
 
-    if not argv[1:]:
+    if not altv[1:]:
         usage = __doc__.strip().splitlines()[0]
         sys.stderr.write(usage + "\n")
         sys.stderr.write(
@@ -119,13 +514,13 @@ def parse_shell2py_args(argv):
 
     # Strip a "bin/" prefix and/or ".py.gz" suffix from the Verb
 
-    verb = argv[1]
+    verb = altv[1]
     verb = os.path.basename(verb)  # such as "find.py" from "bin/find.py"
     verb = verb.split(os.extsep)[0]  # such as "find" from "find.py.gz"
 
     # Return the Verb inside a Namespace of Parsed Args
 
-    args = argparse.Namespace(verb=verb)
+    args = argparse.Namespace(serve=False, batch=None, fast=fast, verb=verb)
 
     return args
 
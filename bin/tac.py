@@ -20,6 +20,7 @@ examples:
   (echo A; echo B; echo C; echo -n Z) |tac -  # echo ZC; echo B; echo A
 """
 
+import functools
 import sys
 import textwrap
 
@@ -31,6 +32,7 @@ def main():
     _scraps_.module_name__main(__name__, argv__to_py=argv__to_tac_py)
 
 
+@functools.lru_cache(maxsize=None)
 def compile_tac_argdoc():
 
     parser = _scraps_.compile_argdoc(epi="quirks:")
@@ -46,13 +48,21 @@ def compile_tac_argdoc():
     return parser
 
 
-def argv__to_tac_py(argv):
+def argv__to_tac_fast_py(argv):
+    """Write the Python for a Tac ArgV that runs fast, else print some Help and quit"""
+
+    py = argv__to_tac_py(argv, fast=True)
+
+    return py
+
+
+def argv__to_tac_py(argv, fast=False):
     """Write the Python for a Tac ArgV, else print some Help and quit"""
 
     parser = compile_tac_argdoc()
     args = parser.parse_args(argv[1:])
     _scraps_.args_cancel_pairs(args)
-    module_py = _scraps_.module_name__readlines(__name__)
+    index = _scraps_.module_name__index(__name__)
 
     files = args.files if args.files else "-".split()
     files = list(("/dev/stdin" if (_ == "-") else _) for _ in files)
@@ -69,12 +79,16 @@ def argv__to_tac_py(argv):
 
     # Form enough more sourcelines
 
+    if fast:
+        py1 = py1.replace("tac_file(", "tac_file_fast(")
+
     py2 = py1
-    py2 = _scraps_.py_pick_lines(py=py2, module_py=module_py)
+    py2 = _scraps_.py_pick_closure(py=py2, index=index, edit=lambda py: py)
+    py2 = py2.replace("tac_file_fast(", "tac_file(")
     assert py2 != py1, py1
 
     py3 = py2
-    py3 = _scraps_.py_add_imports(py=py3, module_py=module_py)
+    py3 = _scraps_.py_add_imports(py=py3, index=index)
     assert py3 != py2, py2
 
     # Inject strings, last of all
@@ -103,6 +117,27 @@ def tac_file(file):
         sys.stdout.write(line)
 
 
+def tac_file_fast(file):
+
+    with open(file) as reading:
+        isatty = reading.isatty()
+
+        if isatty:
+            sys.stderr.write("Press ⌃D EOF to quit\n")
+
+        chars = reading.read()
+
+    if isatty:
+        sys.stderr.write("\n")
+
+    lines = chars.split("\n")
+    tail = lines.pop()  # the chars after the last line break, if any
+    if lines:
+        chars = tail + "\n".join(lines[::-1]) + "\n"
+
+    sys.stdout.write(chars)
+
+
 if __name__ == "__main__":
     main()
 
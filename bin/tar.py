@@ -47,6 +47,7 @@ examples:
 
 import datetime as dt
 import fnmatch
+import functools
 import os
 import sys
 import tarfile
@@ -61,11 +62,11 @@ def main():
 
     _scraps_.module_name__main(__name__, argv__to_py=argv__to_tar_py)
 
-    if hasattr(main, "args"):
-        if main.args.dict:
-            BYTES_BY_NAME.update(_scraps_.BYTES_BY_NAME)
+    if "BYTES_BY_NAME" in vars(_scraps_):  # as defined by the Python of 'tar -x --dict'
+        BYTES_BY_NAME.update(_scraps_.BYTES_BY_NAME)
 
 
+@functools.lru_cache(maxsize=None)
 def compile_tar_argdoc():
 
     parser = _scraps_.compile_argdoc(epi="quirks:")
@@ -148,9 +149,8 @@ def argv__to_tar_py(argv):
     parser = compile_tar_argdoc()
     args = parser.parse_args(altv[1:])
     _scraps_.args_cancel_pairs(args)
-    main.args = args
 
-    module_py = _scraps_.module_name__readlines(__name__)
+    index = _scraps_.module_name__index(__name__)
 
     # Reject obvious contradictions
 
@@ -184,7 +184,7 @@ def argv__to_tar_py(argv):
     # Add its Import's and Func's, delete its Dead Code
 
     py2 = edit_tar_py(
-        py=py1, args=args, module_py=module_py, commons=commons, specials=specials
+        py=py1, args=args, index=index, commons=commons, specials=specials
     )
 
     # Inject strings, last of all
@@ -199,39 +199,38 @@ def argv__to_tar_py(argv):
     return py3
 
 
-def edit_tar_py(py, args, module_py, commons, specials):
-    """Fill out the next layer of missing Source Lines of an Tar Py"""
+def edit_tar_py(py, args, index, commons, specials):
+    """Fill out the missing Source Lines of an Tar Py"""
 
-    py1 = py
-
-    count = 0
-    while True:
-        count += 1
-        assert count <= 4, count
-
-        py0 = py1
-
-        # Look for one more expansion
+    py1 = _scraps_.py_pick_closure(
+        py=py,
+        index=index,
+        edit=lambda py: edit_tar_def_py(
+            py, args=args, commons=commons, specials=specials
+        ),
+    )
+    assert py1 != py, py
 
-        py1 = _scraps_.py_pick_lines(py=py1, module_py=module_py)
+    py2 = _scraps_.py_add_imports(py=py1, index=index)
+    assert py2 != py1, py1
 
-        argnames = "v k O dict".split()
-        py1 = _scraps_.py_dedent_args(py=py1, args=args, argnames=argnames)
-        py1 = _scraps_.py_dedent_bool(py=py1, name="patterns", truthy=args.patterns)
+    return py2
 
-        for (common, special) in zip(commons, specials):
-            py1 = py1.replace(common, special)
 
-        # Succeed when no more expansion found
+def edit_tar_def_py(py, args, commons, specials):
+    """Keep only the chosen options of a piece of Tar Py"""
 
-        if py0 == py1:
+    py1 = py
 
-            assert count >= 2, count
+    argnames = "v k O dict".split()
+    py1 = _scraps_.py_dedent_args(
+        py=py1, args=args, argnames=argnames, patterns=args.patterns
+    )
 
-            py1 = _scraps_.py_add_imports(py=py0, module_py=module_py)
-            assert py1 != py0, py0
+    for (common, special) in zip(commons, specials):
+        py1 = py1.replace(common, special)
 
-            return py1
+    return py1
 
 
 def exit_unless_simple_tar(args):  # noqa Flake8 C901 too complex (11)